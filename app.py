@@ -7,18 +7,35 @@ It provides an interactive web interface with visualizations and reporting capab
 Author: noomesk
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from collections import Counter
+import hashlib
+import io
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up JSON report downloads
+    orjson = None
+
+# pandas and plotly.express are imported inside the functions that use them,
+# so the welcome page renders without paying for them
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Import our custom modules
-from src.parser import load_sequences, detect_file_format, ParsingError
-from src.validator import validate_sequences, get_validation_summary, calculate_gc_content
+from src.parser import format_fasta_record, load_sequences_from_bytes, ParsingError
+from src.validator import PARALLEL_MIN_SEQUENCES, validate_sequences_parallel, get_validation_summary, calculate_gc_content
 from src.stats import generate_report, save_report
 
 
@@ -31,239 +48,24 @@ st.set_page_config(
 )
 
 
-def main():
-    """Main Streamlit application."""
-    
-    # --- MODERN DARK THEME WITH DNA ANIMATION ---
-    st.html("""
-    <style>
-        /* --- VARIABLES --- */
-        :root {
-            --bg-color: #000000;
-            --surface-color: #09090b;
-            --border-color: #27272a;
-            --text-primary: #f4f4f5;
-            --text-secondary: #a1a1aa;
-            --accent-primary: #7c3aed;
-            --accent-glow: rgba(124, 58, 237, 0.5);
-            --success-color: #10b981;
-            --card-bg: #111113;
-        }
+THEME_CSS_PATH = Path(__file__).parent / "static" / "theme.css"
 
-        /* --- TYPOGRAPHY --- */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+# Entries kept by each cache of data derived from validation results; the
+# caches are shared by all sessions, so they must not grow without bound
+RESULT_CACHE_ENTRIES = 8
 
-        html, body, .stApp {
-            background-color: var(--bg-color);
-            color: var(--text-primary);
-            font-family: 'Inter', sans-serif;
-        }
 
-        /* --- SIDEBAR --- */
-        .stSidebar {
-            background-color: var(--surface-color);
-            border-right: 1px solid var(--border-color);
-        }
-        
-        /* --- BUTTONS --- */
-        .stButton > button {
-            background: linear-gradient(180deg, #18181b 0%, #09090b 100%);
-            border: 1px solid var(--border-color);
-            color: var(--text-primary);
-            border-radius: 6px;
-            padding: 0.5rem 1rem;
-            font-weight: 500;
-            transition: all 0.2s ease;
-        }
-        .stButton > button:hover {
-            border-color: var(--accent-primary);
-            box-shadow: 0 0 12px var(--accent-glow);
-            transform: translateY(-1px);
-            color: white;
-        }
-        .stButton > button:active {
-            transform: translateY(0);
-        }
+@st.cache_resource
+def _load_theme_css() -> str:
+    """Read the app stylesheet once per server process."""
+    return THEME_CSS_PATH.read_text(encoding="utf-8")
 
-        /* --- CARDS & CONTAINERS --- */
-        .block-container {
-            padding-top: 2rem;
-        }
-        
-        div[data-testid="stMetricValue"] {
-            font-family: 'Inter', sans-serif;
-            font-weight: 700;
-        }
 
-        /* --- ANIMATIONS --- */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        @keyframes shine {
-            0% { background-position: 200% center; }
-            100% { background-position: -200% center; }
-        }
-        
-        @keyframes float {
-            0%, 100% { transform: translateY(0px) rotate(0deg); }
-            50% { transform: translateY(-20px) rotate(5deg); }
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 0.3; }
-            50% { opacity: 0.6; }
-        }
-
-        /* --- DNA BACKGROUND --- */
-        .dna-background {
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            overflow: hidden;
-            z-index: 0;
-            opacity: 0.15;
-        }
-        
-        .dna-strand {
-            position: absolute;
-            width: 4px;
-            height: 200px;
-            background: linear-gradient(to bottom, 
-                var(--accent-primary) 0%, 
-                var(--success-color) 50%, 
-                var(--accent-primary) 100%);
-            border-radius: 4px;
-            animation: float 6s ease-in-out infinite;
-        }
-        
-        .dna-strand:nth-child(1) { left: 10%; top: 10%; animation-delay: 0s; }
-        .dna-strand:nth-child(2) { left: 30%; top: 60%; animation-delay: 1s; }
-        .dna-strand:nth-child(3) { left: 50%; top: 30%; animation-delay: 2s; }
-        .dna-strand:nth-child(4) { left: 70%; top: 70%; animation-delay: 3s; }
-        .dna-strand:nth-child(5) { left: 90%; top: 20%; animation-delay: 4s; }
-        
-        .dna-helix {
-            position: absolute;
-            width: 80px;
-            height: 80px;
-            border: 2px solid var(--accent-primary);
-            border-radius: 50%;
-            animation: pulse 3s ease-in-out infinite;
-        }
-        
-        .dna-helix:nth-child(6) { left: 20%; top: 40%; animation-delay: 0.5s; }
-        .dna-helix:nth-child(7) { left: 60%; top: 50%; animation-delay: 1.5s; }
-        .dna-helix:nth-child(8) { left: 80%; top: 15%; animation-delay: 2.5s; }
-
-        /* --- HERO SECTION --- */
-        .hero-wrapper {
-            position: relative;
-            width: 100%;
-            min-height: 80vh;
-            overflow: hidden;
-        }
-        
-        .hero-container {
-            position: relative;
-            z-index: 1;
-            text-align: center;
-            padding: 4rem 1rem;
-            animation: fadeIn 0.8s ease-out;
-        }
-        
-        .hero-title {
-            font-size: 3.5rem;
-            font-weight: 800;
-            background: linear-gradient(
-                90deg,
-                rgba(255, 255, 255, 0.1) 0%,
-                rgba(255, 255, 255, 0.3) 30%,
-                rgba(255, 255, 255, 0.6) 45%,
-                #ffffff 50%,
-                rgba(255, 255, 255, 0.6) 55%,
-                rgba(255, 255, 255, 0.3) 70%,
-                rgba(255, 255, 255, 0.1) 100%
-            );
-            background-size: 200% auto;
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            animation: shine 5s linear infinite;
-            margin-bottom: 1rem;
-            letter-spacing: -0.05em;
-        }
-        
-        .hero-subtitle {
-            font-size: 1.25rem;
-            color: var(--text-secondary);
-            max-width: 600px;
-            margin: 0 auto 2rem auto;
-            line-height: 1.6;
-        }
-        
-        .feature-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 1.5rem;
-            margin-top: 3rem;
-        }
-        
-        .feature-card {
-            background: var(--card-bg);
-            border: 1px solid var(--border-color);
-            padding: 1.5rem;
-            border-radius: 12px;
-            text-align: left;
-            transition: all 0.3s ease;
-        }
-        
-        .feature-card:hover {
-            border-color: var(--accent-primary);
-            box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-            transform: translateY(-5px);
-        }
-        
-        .feature-title {
-            font-weight: 600;
-            color: var(--text-primary);
-            margin-bottom: 0.5rem;
-            font-size: 1.1rem;
-        }
-        
-        .feature-desc {
-            font-size: 0.9rem;
-            color: var(--text-secondary);
-        }
-        
-        /* Hide default Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        
-        /* Completely remove toolbar and decoration */
-        [data-testid="stToolbar"] {
-            display: none !important;
-        }
-        [data-testid="stDecoration"] {
-            display: none !important;
-        }
-        
-        /* Make header transparent and non-blocking */
-        header[data-testid="stHeader"] {
-            background: transparent !important;
-            pointer-events: none !important;
-        }
-        
-        /* Re-enable clicks only for sidebar toggle */
-        header[data-testid="stHeader"] button {
-            pointer-events: auto !important;
-        }
-        
-    </style>
-    """)
+def main():
+    """Main Streamlit application."""
+    
+    # --- MODERN DARK THEME WITH DNA ANIMATION ---
+    st.html(f"<style>{_load_theme_css()}</style>")
     
     # Initialize session state
     if 'validation_results' not in st.session_state:
@@ -306,30 +108,11 @@ def main():
             process_btn = st.button("Process File", use_container_width=True)
             
             if process_btn:
-                try:
-                    # Save uploaded file temporarily
-                    temp_dir = Path("temp")
-                    temp_dir.mkdir(exist_ok=True)
-                    file_path = temp_dir / uploaded_file.name
-                    
-                    with open(file_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
-                    
-                    # Process file
-                    with st.spinner("Processing sequences..."):
-                        sequences = load_sequences(str(file_path))
-                        results = validate_sequences(sequences, min_length, sanitize_mode)
-                        
-                        st.session_state.validation_results = results
-                        st.session_state.processing_complete = True
-                        st.session_state.current_file_name = uploaded_file.name
-                        
+                processed = process_sequences(uploaded_file.getvalue(), sanitize_mode, min_length)
+                
+                if processed:
+                    st.session_state.current_file_name = uploaded_file.name
                     st.success("Analysis Complete!")
-                    
-                except ParsingError as e:
-                    st.error(f"File parsing error: {str(e)}")
-                except Exception as e:
-                    st.error(f"An error occurred: {str(e)}")
 
     # Main content area
     if st.session_state.validation_results:
@@ -338,41 +121,88 @@ def main():
         display_hero()
 
 
-def save_uploaded_file(uploaded_file) -> str:
-    """Save uploaded file to temporary location."""
-    temp_dir = Path("temp")
-    temp_dir.mkdir(exist_ok=True)
+@st.cache_resource
+def _validation_executor() -> Optional[ProcessPoolExecutor]:
+    """Process pool for validating large files, shared across reruns and sessions.
+    
+    Returns None on single-core hosts, where validation runs serially.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2:
+        return None
+    # spawn: forking the multi-threaded Streamlit server is unsafe
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _validate_with_progress(sequences: List[Tuple[str, str]], min_length: int, sanitize: bool) -> List[Dict]:
+    """Validate sequences in chunks, updating a progress panel as each chunk completes."""
+    total = len(sequences)
+    panel = st.empty()
+    done = valid = 0
+    
+    def on_chunk(chunk_results: List[Dict]):
+        nonlocal done, valid
+        done += len(chunk_results)
+        valid += sum(1 for r in chunk_results if r['is_valid'])
+        panel.progress(done / total, text=f"Validated {done} of {total} sequences ({valid} valid so far)")
+    
+    executor = _validation_executor() if total > PARALLEL_MIN_SEQUENCES else None
+    validation_results = validate_sequences_parallel(
+        sequences, min_length, sanitize, executor=executor, on_chunk=on_chunk
+    )
+    
+    panel.empty()
+    return validation_results
+
+
+def _sequence_arrays(validation_results: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute per-sequence length, GC content, truncated header and sanitized flag in one pass."""
+    n = len(validation_results)
+    lengths = np.empty(n, dtype=np.int32)
+    gc_content = np.empty(n, dtype=np.float32)
+    short_headers = np.empty(n, dtype=object)
+    is_sanitized = np.empty(n, dtype=bool)
     
-    temp_file = temp_dir / uploaded_file.name
-    with open(temp_file, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    for i, result in enumerate(validation_results):
+        sequence = result.get('corrected_sequence') or result.get('original_sequence', '')
+        header = result['header']
+        lengths[i] = len(sequence)
+        gc_content[i] = calculate_gc_content(sequence)
+        short_headers[i] = header[:30] + '...' if len(header) > 30 else header
+        is_sanitized[i] = result['sanitized']
     
-    return str(temp_file)
+    return lengths, gc_content, short_headers, is_sanitized
 
 
-def process_sequences(file_path: str, sanitize: bool, min_length: int):
+def process_sequences(file_bytes: bytes, sanitize: bool, min_length: int) -> bool:
     """Process sequences and store results in session state."""
+    # Content-addressed key for the derived-data caches below
+    results_key = f"{hashlib.sha1(file_bytes).hexdigest()}:{min_length}:{int(sanitize)}"
+    if st.session_state.get('results_key') == results_key:
+        # Same file and settings as the results already on screen
+        return True
+    
     try:
-        # Load sequences
-        sequences = load_sequences(file_path)
-        st.session_state.sequences = sequences
-        
-        # Validate sequences
-        validation_results = validate_sequences(sequences, min_length, sanitize)
-        st.session_state.validation_results = validation_results
-        st.session_state.processed_file = file_path
-        
-        # Clean up temp file
-        temp_file = Path(file_path)
-        if temp_file.parent.name == "temp":
-            temp_file.unlink()
-        
+        with st.spinner("Parsing sequences..."):
+            sequences = load_sequences_from_bytes(file_bytes)
+        validation_results = _validate_with_progress(sequences, min_length, sanitize)
     except ParsingError as e:
         st.error(f"File parsing error: {str(e)}")
-        return
+        return False
     except Exception as e:
-        st.error(f"Unexpected error: {str(e)}")
-        return
+        st.error(f"An error occurred: {str(e)}")
+        return False
+    
+    st.session_state.validation_results = validation_results
+    (st.session_state.lengths,
+     st.session_state.gc_content,
+     st.session_state.short_headers,
+     st.session_state.is_sanitized) = _sequence_arrays(validation_results)
+    st.session_state.processing_complete = True
+    st.session_state.results_key = results_key
+    # A report generated for the previous results would be cached under this key
+    st.session_state.pop('generated_report', None)
+    return True
 
 
 def display_hero():
@@ -438,7 +268,7 @@ def display_hero():
 def display_results():
     """Display processing results in organized tabs."""
     
-    summary = get_validation_summary(st.session_state.validation_results)
+    summary = _validation_summary(st.session_state.results_key, st.session_state.validation_results)
     
     # Create tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -461,8 +291,46 @@ def display_results():
         display_reports_tab(summary)
 
 
+QUALITY_COLORS = {
+    'High Quality': '#2ecc71',
+    'Medium Quality': '#f39c12',
+    'Low Quality': '#e74c3c',
+    'Unusable': '#95a5a6'
+}
+
+
+@st.cache_resource
+def _chart_layout(kind: str) -> Dict:
+    """Shared layout settings for a chart kind ("bar", "pie" or "scatter").
+    
+    Built once per server process; callers unpack it into ``update_layout``
+    and must not modify it.
+    """
+    layouts = {
+        'bar': {'height': 400, 'showlegend': False},
+        'pie': {'height': 400},
+        'scatter': {'height': 500},
+    }
+    return layouts[kind]
+
+
+@st.cache_data(show_spinner=False, max_entries=RESULT_CACHE_ENTRIES)
+def _validation_summary(results_key: str, _validation_results: List[Dict]) -> Dict:
+    """Summarize validation results, cached on ``results_key``."""
+    return get_validation_summary(_validation_results)
+
+
+@st.cache_data(show_spinner=False, max_entries=RESULT_CACHE_ENTRIES)
+def _quality_distribution(results_key: str, _validation_results: List[Dict]) -> Dict:
+    """Quality distribution of validation results, cached on ``results_key``."""
+    return calculate_quality_distribution(_validation_results)
+
+
 def display_summary_tab(summary: Dict):
     """Display summary metrics."""
+    import pandas as pd
+    import plotly.express as px
+    
     st.header("Processing Summary")
     
     # Key metrics in columns
@@ -519,10 +387,9 @@ def display_summary_tab(summary: Dict):
         )
         
         fig.update_layout(
+            **_chart_layout('bar'),
             xaxis_title="Error Type",
-            yaxis_title="Number of Sequences",
-            showlegend=False,
-            height=400
+            yaxis_title="Number of Sequences"
         )
         
         st.plotly_chart(fig, use_container_width=True)
@@ -531,7 +398,7 @@ def display_summary_tab(summary: Dict):
     st.subheader("Quality Distribution")
     
     # Calculate quality distribution
-    quality_dist = calculate_quality_distribution(st.session_state.validation_results)
+    quality_dist = _quality_distribution(st.session_state.results_key, st.session_state.validation_results)
     
     col1, col2 = st.columns(2)
     
@@ -542,14 +409,9 @@ def display_summary_tab(summary: Dict):
                 values=list(quality_dist.values()),
                 names=list(quality_dist.keys()),
                 title="Sequence Quality Distribution",
-                color_discrete_map={
-                    'High Quality': '#2ecc71',
-                    'Medium Quality': '#f39c12', 
-                    'Low Quality': '#e74c3c',
-                    'Unusable': '#95a5a6'
-                }
+                color_discrete_map=QUALITY_COLORS
             )
-            fig_pie.update_layout(height=400)
+            fig_pie.update_layout(**_chart_layout('pie'))
             st.plotly_chart(fig_pie, use_container_width=True)
     
     with col2:
@@ -569,23 +431,23 @@ def display_validation_tab():
         st.warning("No validation results available.")
         return
     
-    # Prepare data for table
-    table_data = []
-    for result in st.session_state.validation_results:
-        row = {
-            'Index': result['sequence_index'],
-            'Header': result['header'],
-            'Length': result.get('original_length', 0),
-            'Status': 'Valid' if result['is_valid'] else 'Invalid',
-            'Errors': '; '.join(result['errors']) if result['errors'] else 'None',
-            'Warnings': '; '.join(result['warnings']) if result['warnings'] else 'None',
-            'GC Content %': f"{calculate_gc_content(result.get('corrected_sequence', result.get('original_sequence', ''))):.2f}",
-            'Sanitized': 'Yes' if result.get('corrected_sequence') != result.get('original_sequence', '') else 'No'
-        }
-        table_data.append(row)
+    df = _build_table_df(
+        st.session_state.results_key,
+        st.session_state.validation_results,
+        st.session_state.gc_content,
+        st.session_state.is_sanitized
+    )
     
-    df = pd.DataFrame(table_data)
+    _validation_table_fragment(df)
+
+
+@st.fragment
+def _validation_table_fragment(df: pd.DataFrame):
+    """Render the filter widgets and results table.
     
+    Runs as a fragment, so changing a filter only reruns this block instead
+    of the whole app.
+    """
     # Add filtering options
     st.subheader("Filter and Search")
     
@@ -611,23 +473,22 @@ def display_validation_tab():
             placeholder="Type to search..."
         )
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as boolean masks on the raw columns
+    mask = np.ones(len(df), dtype=bool)
     
     if status_filter != 'All':
-        if status_filter == 'Valid':
-            filtered_df = filtered_df[filtered_df['Status'].str.contains('Valid')]
-        else:
-            filtered_df = filtered_df[filtered_df['Status'].str.contains('Invalid')]
+        is_valid = df['is_valid'].to_numpy()
+        mask &= is_valid if status_filter == 'Valid' else ~is_valid
     
     if sanitized_filter != 'All':
-        if sanitized_filter == 'Sanitized':
-            filtered_df = filtered_df[filtered_df['Sanitized'] == 'Yes']
-        else:
-            filtered_df = filtered_df[filtered_df['Sanitized'] == 'No']
+        is_sanitized = df['is_sanitized'].to_numpy()
+        mask &= is_sanitized if sanitized_filter == 'Sanitized' else ~is_sanitized
     
     if search_term:
-        filtered_df = filtered_df[filtered_df['Header'].str.contains(search_term, case=False, na=False)]
+        mask &= df['Header'].str.contains(search_term, case=False, regex=False).to_numpy(dtype=bool)
+    
+    # Only the surviving rows are formatted for display
+    filtered_df = _format_table(df[mask])
     
     # Display results count
     st.info(f"Showing {len(filtered_df)} of {len(df)} sequences")
@@ -642,6 +503,10 @@ def display_validation_tab():
                 'Header',
                 width='large'
             ),
+            'GC Content %': st.column_config.NumberColumn(
+                'GC Content %',
+                format='%.2f'
+            ),
             'Errors': st.column_config.TextColumn(
                 'Errors',
                 width='medium'
@@ -664,6 +529,56 @@ def display_validation_tab():
         )
 
 
+@st.cache_resource(show_spinner=False, max_entries=RESULT_CACHE_ENTRIES)
+def _build_table_df(results_key: str, _validation_results: List[Dict],
+                    _gc_content: np.ndarray, _is_sanitized: np.ndarray) -> pd.DataFrame:
+    """Build the unformatted validation table, cached on ``results_key``.
+    
+    Status and sanitization are kept as plain numpy boolean columns so
+    filters are zero-copy masks; ``_format_table`` turns them into display
+    strings. The remaining columns use Arrow-backed dtypes. The same frame
+    is shared across reruns (no copy per cache hit), so callers must not
+    modify it in place.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    
+    n = len(_validation_results)
+    # Going through an Arrow table skips pandas' object-column inference
+    df = pa.table({
+        'Index': np.fromiter((r['sequence_index'] for r in _validation_results), dtype=np.int64, count=n),
+        'Header': [r['header'] for r in _validation_results],
+        'Length': np.fromiter((r.get('original_length', 0) for r in _validation_results), dtype=np.int64, count=n),
+        'Errors': ['; '.join(r['errors']) if r['errors'] else 'None' for r in _validation_results],
+        'Warnings': ['; '.join(r['warnings']) if r['warnings'] else 'None' for r in _validation_results],
+        'GC Content %': _gc_content
+    }).to_pandas(types_mapper=pd.ArrowDtype)
+    
+    df['is_valid'] = np.fromiter((r['is_valid'] for r in _validation_results), dtype=bool, count=n)
+    df['is_sanitized'] = _is_sanitized
+    
+    return df
+
+
+def _format_table(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a (filtered) base table into the columns shown to the user."""
+    import pandas as pd
+    
+    is_valid = df['is_valid'].to_numpy()
+    is_sanitized = df['is_sanitized'].to_numpy()
+    
+    return pd.DataFrame({
+        'Index': df['Index'],
+        'Header': df['Header'],
+        'Length': df['Length'],
+        'Status': np.where(is_valid, 'Valid', 'Invalid'),
+        'Errors': df['Errors'],
+        'Warnings': df['Warnings'],
+        'GC Content %': df['GC Content %'].round(2),
+        'Sanitized': np.where(is_sanitized, 'Yes', 'No')
+    })
+
+
 def display_visualizations_tab():
     """Display interactive visualizations."""
     st.header("Sequence Visualizations")
@@ -672,19 +587,13 @@ def display_visualizations_tab():
         st.warning("No data available for visualization.")
         return
     
-    # Prepare data
-    lengths = []
-    gc_contents = []
-    headers = []
+    # Only sequences with content are plotted
+    has_sequence = st.session_state.lengths > 0
+    lengths = st.session_state.lengths[has_sequence]
+    gc_contents = st.session_state.gc_content[has_sequence]
+    short_headers = st.session_state.short_headers[has_sequence]
     
-    for result in st.session_state.validation_results:
-        sequence = result.get('corrected_sequence') or result.get('original_sequence', '')
-        if sequence:
-            lengths.append(len(sequence))
-            gc_contents.append(calculate_gc_content(sequence))
-            headers.append(result['header'])
-    
-    if not lengths:
+    if not len(lengths):
         st.warning("No valid sequences for visualization.")
         return
     
@@ -692,17 +601,15 @@ def display_visualizations_tab():
     col1, col2 = st.columns(2)
     
     with col1:
-        # Length distribution histogram
-        fig_length = px.histogram(
-            x=lengths,
-            nbins=30,
+        # Length distribution histogram, binned server-side
+        fig_length = _binned_histogram(
+            lengths,
             title="Distribution of Sequence Lengths",
-            labels={'x': 'Sequence Length (bp)', 'y': 'Frequency'}
+            hover_label="Length (bp)"
         )
         
         fig_length.update_layout(
-            height=400,
-            showlegend=False,
+            **_chart_layout('bar'),
             xaxis_title="Length (bp)",
             yaxis_title="Count"
         )
@@ -710,17 +617,15 @@ def display_visualizations_tab():
         st.plotly_chart(fig_length, use_container_width=True)
     
     with col2:
-        # GC content distribution
-        fig_gc = px.histogram(
-            x=gc_contents,
-            nbins=30,
+        # GC content distribution, binned server-side
+        fig_gc = _binned_histogram(
+            gc_contents,
             title="Distribution of GC Content",
-            labels={'x': 'GC Content (%)', 'y': 'Frequency'}
+            hover_label="GC Content (%)"
         )
         
         fig_gc.update_layout(
-            height=400,
-            showlegend=False,
+            **_chart_layout('bar'),
             xaxis_title="GC Content (%)",
             yaxis_title="Count"
         )
@@ -730,25 +635,24 @@ def display_visualizations_tab():
     # Scatter plot: Length vs GC Content
     st.subheader("Length vs GC Content Analysis")
     
-    # Create scatter plot dataframe
-    scatter_df = pd.DataFrame({
-        'Length': lengths,
-        'GC Content': gc_contents,
-        'Header': [h[:30] + '...' if len(h) > 30 else h for h in headers],
-        'Index': range(len(lengths))
-    })
-    
-    fig_scatter = px.scatter(
-        scatter_df,
-        x='Length',
-        y='GC Content',
-        hover_data=['Header'],
-        title="Sequence Length vs GC Content",
-        labels={'Length': 'Length (bp)', 'GC Content': 'GC Content (%)'}
-    )
+    # Downsample large inputs before shipping points to the browser
+    plot_idx = np.arange(len(lengths))
+    if len(lengths) > SCATTER_MAX_POINTS:
+        order = np.argsort(lengths, kind='stable')
+        plot_idx = order[_lttb_indices(lengths[order], gc_contents[order], SCATTER_MAX_POINTS)]
+        st.caption(f"Showing {len(plot_idx)} of {len(lengths)} points (LTTB downsampled)")
+    
+    fig_scatter = go.Figure(go.Scattergl(
+        x=lengths[plot_idx],
+        y=gc_contents[plot_idx],
+        mode='markers',
+        customdata=short_headers[plot_idx],
+        hovertemplate="Length: %{x} bp<br>GC Content: %{y:.2f}%<br>%{customdata}<extra></extra>"
+    ))
     
     fig_scatter.update_layout(
-        height=500,
+        **_chart_layout('scatter'),
+        title="Sequence Length vs GC Content",
         xaxis_title="Sequence Length (bp)",
         yaxis_title="GC Content (%)"
     )
@@ -759,21 +663,25 @@ def display_visualizations_tab():
     st.subheader("GC Content by Length Categories")
     
     # Create length categories
-    scatter_df['Length Category'] = pd.cut(
-        scatter_df['Length'], 
-        bins=5, 
-        labels=['Very Short', 'Short', 'Medium', 'Long', 'Very Long']
-    )
-    
-    fig_box = px.box(
-        scatter_df,
-        x='Length Category',
-        y='GC Content',
-        title="GC Content Distribution by Length Category"
-    )
+    categories = _length_categories(lengths)
+    
+    # Large inputs send precomputed box statistics instead of every point
+    summarize = len(lengths) > SCATTER_MAX_POINTS
+    
+    fig_box = go.Figure()
+    for i, label in enumerate(LENGTH_CATEGORY_LABELS):
+        category_gc = gc_contents[categories == i]
+        if not len(category_gc):
+            continue
+        if summarize:
+            fig_box.add_trace(go.Box(x=[label], name=label, marker_color='#636efa',
+                                     **_box_statistics(category_gc)))
+        else:
+            fig_box.add_trace(go.Box(y=category_gc, name=label, marker_color='#636efa'))
     
     fig_box.update_layout(
-        height=400,
+        **_chart_layout('bar'),
+        title="GC Content Distribution by Length Category",
         xaxis_title="Length Category",
         yaxis_title="GC Content (%)"
     )
@@ -781,15 +689,114 @@ def display_visualizations_tab():
     st.plotly_chart(fig_box, use_container_width=True)
 
 
+HISTOGRAM_BINS = 30
+SCATTER_MAX_POINTS = 5000
+LENGTH_CATEGORY_LABELS = ['Very Short', 'Short', 'Medium', 'Long', 'Very Long']
+
+
+def _length_categories(lengths: np.ndarray) -> np.ndarray:
+    """Assign each length to one of five equal-width buckets.
+    
+    Matches ``pd.cut(lengths, bins=5)``: intervals are right-closed and a
+    constant input is widened by 0.1% so it lands in the middle bucket.
+    """
+    low, high = float(lengths.min()), float(lengths.max())
+    if low == high:
+        low, high = low - 0.001 * abs(low), high + 0.001 * abs(high)
+    
+    edges = np.linspace(low, high, len(LENGTH_CATEGORY_LABELS) + 1)[1:-1]
+    return np.searchsorted(edges, lengths, side='left')
+
+
+def _binned_histogram(values: np.ndarray, title: str, hover_label: str,
+                      bins: int = HISTOGRAM_BINS) -> go.Figure:
+    """Build a histogram from counts binned with numpy, so only the bins are sent to the browser."""
+    counts, edges = np.histogram(values, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    
+    fig = go.Figure(go.Bar(
+        x=centers,
+        y=counts,
+        width=np.diff(edges),
+        hovertemplate=f"{hover_label}: %{{x:.2f}}<br>Count: %{{y}}<extra></extra>"
+    ))
+    fig.update_layout(title=title, bargap=0)
+    return fig
+
+
+def _box_statistics(values: np.ndarray) -> Dict[str, List[float]]:
+    """Precompute box plot statistics the way Plotly does (linear quartiles, 1.5 IQR fences)."""
+    q1, median, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    lower = values[values >= q1 - 1.5 * iqr].min()
+    upper = values[values <= q3 + 1.5 * iqr].max()
+    
+    return {
+        'q1': [float(q1)],
+        'median': [float(median)],
+        'q3': [float(q3)],
+        'lowerfence': [float(lower)],
+        'upperfence': [float(upper)]
+    }
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select ``threshold`` points with Largest-Triangle-Three-Buckets downsampling.
+    
+    Args:
+        x (np.ndarray): X values, sorted ascending
+        y (np.ndarray): Y values aligned with ``x``
+        threshold (int): Number of points to keep
+        
+    Returns:
+        np.ndarray: Indices of the selected points, in ascending order
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    
+    # First and last points are always kept; the rest is split into buckets
+    bucket_edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = bucket_edges[i], bucket_edges[i + 1]
+        # Average of the next bucket (or the last point) is the third vertex
+        next_start, next_end = end, bucket_edges[i + 2] if i + 2 < len(bucket_edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+    
+    return selected
+
+
+@st.fragment
 def display_reports_tab(summary: Dict):
-    """Display and download reports."""
+    """Display and download reports.
+    
+    Runs as a fragment so the report and export buttons only rerun this tab.
+    """
     st.header("Reports & Export")
     
     # Generate comprehensive report
     if st.button("Generate Comprehensive Report"):
         with st.spinner("Generating report..."):
             try:
-                report_data = generate_report(st.session_state.validation_results)
+                report_data = _generated_report(
+                    st.session_state.results_key, st.session_state.validation_results
+                )
                 st.session_state.generated_report = report_data
                 st.success("Report generated successfully!")
             except Exception as e:
@@ -821,7 +828,7 @@ def display_reports_tab(summary: Dict):
         
         with col1:
             # JSON report
-            json_data = json.dumps(report, indent=2)
+            json_data = _report_json(st.session_state.results_key, report)
             st.download_button(
                 label="Download JSON Report",
                 data=json_data,
@@ -848,7 +855,9 @@ def display_reports_tab(summary: Dict):
     
     if st.button("Export Valid Sequences (FASTA)"):
         try:
-            fasta_content = generate_fasta_export(st.session_state.validation_results)
+            fasta_content = generate_fasta_export(
+                st.session_state.results_key, st.session_state.validation_results
+            )
             st.download_button(
                 label="Download Clean FASTA",
                 data=fasta_content,
@@ -859,67 +868,70 @@ def display_reports_tab(summary: Dict):
             st.error(f"Error generating FASTA: {str(e)}")
 
 
+QUALITY_LABELS = {
+    'high_quality': 'High Quality',
+    'medium_quality': 'Medium Quality',
+    'low_quality': 'Low Quality',
+    'unusable': 'Unusable',
+}
+
+
 def calculate_quality_distribution(validation_results: List[Dict]) -> Dict:
-    """Calculate sequence quality distribution."""
-    quality_levels = {
-        'High Quality': 0,
-        'Medium Quality': 0, 
-        'Low Quality': 0,
-        'Unusable': 0
-    }
-    
-    for result in validation_results:
-        has_errors = len(result["errors"]) > 0
-        has_warnings = len(result["warnings"]) > 0
-        
-        if not has_errors:
-            if not has_warnings:
-                quality_levels['High Quality'] += 1
-            else:
-                quality_levels['Medium Quality'] += 1
-        else:
-            can_be_sanitized = any("Invalid characters" in error for error in result["errors"])
-            if can_be_sanitized:
-                quality_levels['Low Quality'] += 1
-            else:
-                quality_levels['Unusable'] += 1
-    
-    return quality_levels
+    """Count sequences per quality level assigned by the validator."""
+    counts = Counter(result['quality'] for result in validation_results)
+    return {label: counts[level] for level, label in QUALITY_LABELS.items()}
+
+
+@st.cache_data(show_spinner=False, max_entries=RESULT_CACHE_ENTRIES)
+def _generated_report(results_key: str, _validation_results: List[Dict]) -> Dict:
+    """Build the comprehensive report, cached on ``results_key``."""
+    return generate_report(_validation_results)
+
+
+@st.cache_data(show_spinner=False, max_entries=RESULT_CACHE_ENTRIES)
+def _report_json(results_key: str, _report: Dict) -> bytes:
+    """Serialize a report for download, cached on ``results_key``."""
+    if orjson is not None:
+        return orjson.dumps(_report, option=orjson.OPT_INDENT_2)
+    return json.dumps(_report, indent=2).encode("utf-8")
 
 
 def generate_csv_report(report: Dict) -> str:
     """Generate CSV content from report data."""
-    lines = ["Metric,Value"]
+    import pandas as pd
     
-    # Add summary metrics
-    for key, value in report['summary'].items():
-        lines.append(f"{key.replace('_', ' ').title()},{value}")
+    summary_df = pd.DataFrame({
+        'Metric': [key.replace('_', ' ').title() for key in report['summary']],
+        'Value': pd.Series(list(report['summary'].values()), dtype=object)
+    })
     
-    # Add top sequences
-    lines.append("")
-    lines.append("Top 10 Longest Sequences")
-    lines.append("Rank,Header,Length,GC Content")
-    for seq in report.get('top_10_longest', []):
-        lines.append(f"{seq['rank']},{seq['header']},{seq['length']},{seq['gc_content']:.2f}")
+    top_df = pd.DataFrame(
+        report.get('top_10_longest', []),
+        columns=['rank', 'header', 'length', 'gc_content']
+    ).rename(columns={
+        'rank': 'Rank', 'header': 'Header', 'length': 'Length', 'gc_content': 'GC Content'
+    })
     
-    return "\n".join(lines)
+    buf = io.StringIO()
+    summary_df.to_csv(buf, index=False, lineterminator="\n")
+    buf.write("\nTop 10 Longest Sequences\n")
+    top_df.to_csv(buf, index=False, float_format="%.2f", lineterminator="\n")
+    return buf.getvalue()
 
 
-def generate_fasta_export(validation_results: List[Dict]) -> str:
-    """Generate FASTA content from valid sequences."""
-    fasta_lines = []
+@st.cache_data(show_spinner=False, max_entries=RESULT_CACHE_ENTRIES)
+def generate_fasta_export(results_key: str, _validation_results: List[Dict]) -> bytes:
+    """Generate FASTA content from valid sequences, cached on ``results_key``."""
+    valid = [r for r in _validation_results if r['is_valid']]
+    records = []
     
-    for result in validation_results:
-        if result['is_valid']:
-            sequence = result.get('corrected_sequence') or result.get('original_sequence', '')
-            if sequence:
-                fasta_lines.append(f">{result['header']}")
-                # Split sequence into 60-character lines
-                for i in range(0, len(sequence), 60):
-                    fasta_lines.append(sequence[i:i+60])
-                fasta_lines.append("")  # Empty line between sequences
+    for result in valid:
+        sequence = result.get('corrected_sequence') or result.get('original_sequence', '')
+        if sequence:
+            records.append(format_fasta_record(result['header'], sequence))
     
-    return "\n".join(fasta_lines)
+    # Empty line between sequences
+    return "\n".join(records).encode('utf-8')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+"""
+Pytest configuration for the repository root.
+
+Author: noomesk
+"""
+
+# test_sidebar.py is a Streamlit script for manual checks (``streamlit run
+# test_sidebar.py``), not a pytest module; collecting it would import
+# Streamlit on every test run
+collect_ignore = ["test_sidebar.py"]
@@ -17,12 +17,15 @@ This package provides:
 __version__ = "1.0.0"
 __author__ = "noomesk"
 
-from .parser import load_sequences
+from .parser import load_sequences, load_sequences_from_bytes, load_sequences_with_format, iter_sequences
 from .validator import validate_sequence
 from .stats import generate_report, save_report
 
 __all__ = [
     "load_sequences",
+    "load_sequences_from_bytes",
+    "load_sequences_with_format",
+    "iter_sequences",
     "validate_sequence", 
     "generate_report",
     "save_report"
@@ -8,9 +8,12 @@ Author: noomesk
 """
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import click
 from rich.console import Console
@@ -18,13 +21,15 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 
-from .parser import load_sequences, detect_file_format, ParsingError
-from .validator import validate_sequences, get_validation_summary
+from .parser import format_fasta_record, iter_sequences, load_sequences_with_format, ParsingError
+from .validator import PARALLEL_MIN_SEQUENCES, validate_sequences_parallel, summarize_sequences, get_validation_summary
 from .stats import generate_report, save_report
 
 
 console = Console()
 
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 def main():
     """Main CLI entry point."""
@@ -46,10 +51,12 @@ def main():
 @click.option('--format', 'report_format', 
               type=click.Choice(['json', 'csv']), 
               default='json', help='Report format (default: json)')
+@click.option('--full-report', is_flag=True, 
+              help='Include per-sequence sections in the report')
 @click.option('--verbose', '-v', is_flag=True, 
               help='Enable verbose output')
 @click.pass_context
-def cli(ctx, input_file, sanitize, min_length, output, report, report_format, verbose):
+def cli(ctx, input_file, sanitize, min_length, output, report, report_format, full_report, verbose):
     """Genome Cleaner - Clean and validate FASTA/FASTQ sequences."""
     
     if ctx.invoked_subcommand is None:
@@ -59,7 +66,8 @@ def cli(ctx, input_file, sanitize, min_length, output, report, report_format, ve
             ctx.exit(1)
         
         try:
-            process_file(input_file, sanitize, min_length, output, report, report_format, verbose)
+            process_file(input_file, sanitize, min_length, output, report, report_format, verbose,
+                         full_report=full_report)
         except Exception as e:
             console.print(f"[red]Error: {str(e)}[/red]")
             sys.exit(1)
@@ -89,17 +97,20 @@ def clean(input_file: str, output: str, min_length: int):
               default='json', help='Report format')
 @click.option('--output', '-o', 
               type=click.Path(), help='Custom report output path')
-def report(input_file: str, report_format: str, output: Optional[str]):
+@click.option('--full-report', is_flag=True, 
+              help='Include per-sequence sections in the report')
+def report(input_file: str, report_format: str, output: Optional[str], full_report: bool):
     """Generate statistical report only."""
     report = True
     process_file(input_file, sanitize=False, min_length=20, output=None, 
                 report=report, report_format=report_format, verbose=True, 
-                custom_report_path=output)
+                custom_report_path=output, full_report=full_report)
 
 
 def process_file(input_file: str, sanitize: bool, min_length: int, 
                 output: Optional[str], report: bool, report_format: str, 
-                verbose: bool, custom_report_path: Optional[str] = None):
+                verbose: bool, custom_report_path: Optional[str] = None,
+                full_report: bool = False):
     """Process a file with validation and optionally generate reports."""
     
     console.print(Panel.fit(
@@ -108,12 +119,14 @@ def process_file(input_file: str, sanitize: bool, min_length: int,
         border_style="blue"
     ))
     
-    # Detect file format
-    file_format = detect_file_format(input_file)
-    if verbose:
-        console.print(f"[green]Detected format:[/green] {file_format.upper()}")
+    # Without an output file, a report or the invalid-sequence listing only
+    # the summary is used, so stream the file into it instead of keeping
+    # every sequence and result
+    if not (sanitize and output) and not report and not verbose:
+        _display_summary(_summarize_file(input_file, min_length, sanitize))
+        return
     
-    # Load sequences
+    # Load sequences, detecting the format in the same pass
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -122,7 +135,7 @@ def process_file(input_file: str, sanitize: bool, min_length: int,
         task = progress.add_task("Loading sequences...", total=None)
         
         try:
-            sequences = load_sequences(input_file)
+            file_format, sequences = load_sequences_with_format(input_file)
             progress.update(task, description="Sequences loaded successfully")
         except ParsingError as e:
             progress.update(task, description="[red]Failed to load sequences[/red]")
@@ -132,6 +145,7 @@ def process_file(input_file: str, sanitize: bool, min_length: int,
             raise click.ClickException(f"Unexpected error: {str(e)}")
     
     if verbose:
+        console.print(f"[green]Detected format:[/green] {file_format.upper()}")
         console.print(f"[green]Loaded {len(sequences)} sequences[/green]")
     
     # Validate sequences
@@ -142,7 +156,10 @@ def process_file(input_file: str, sanitize: bool, min_length: int,
     ) as progress:
         task = progress.add_task("Validating sequences...", total=len(sequences))
         
-        validation_results = validate_sequences(sequences, min_length, sanitize)
+        validation_results = _validate(
+            sequences, min_length, sanitize,
+            on_chunk=lambda chunk: progress.advance(task, len(chunk))
+        )
         
         progress.update(task, description="Validation complete")
     
@@ -158,7 +175,7 @@ def process_file(input_file: str, sanitize: bool, min_length: int,
     
     # Generate report if requested
     if report:
-        report_data = generate_report(validation_results)
+        report_data = generate_report(validation_results, details=full_report)
         report_path = custom_report_path or f"report_{Path(input_file).stem}.{report_format}"
         
         try:
@@ -172,6 +189,63 @@ def process_file(input_file: str, sanitize: bool, min_length: int,
         _display_invalid_sequences(validation_results)
 
 
+def _validate(sequences: List[tuple], min_length: int, sanitize: bool,
+              on_chunk=None) -> List[dict]:
+    """Validate sequences, spreading large inputs across worker processes."""
+    workers = os.cpu_count() or 1
+    if len(sequences) < PARALLEL_MIN_SEQUENCES or workers < 2:
+        return validate_sequences_parallel(sequences, min_length, sanitize, on_chunk=on_chunk)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return validate_sequences_parallel(
+            sequences, min_length, sanitize, executor=executor, on_chunk=on_chunk
+        )
+
+
+def _summarize_file(input_file: str, min_length: int, sanitize: bool) -> dict:
+    """Validate a file as a stream and return its validation summary."""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Validating sequences...", total=None)
+        
+        try:
+            summary = _summarize(
+                iter_sequences(input_file), min_length, sanitize,
+                on_chunk=lambda chunk: progress.advance(task, len(chunk))
+            )
+            progress.update(task, description="Validation complete")
+        except ParsingError as e:
+            progress.update(task, description="[red]Failed to load sequences[/red]")
+            raise click.ClickException(f"Error parsing file: {str(e)}")
+        except Exception as e:
+            progress.update(task, description="[red]Unexpected error[/red]")
+            raise click.ClickException(f"Unexpected error: {str(e)}")
+    
+    if not summary['total_sequences']:
+        raise click.ClickException("Error parsing file: No valid sequences found in file")
+    
+    return summary
+
+
+def _summarize(sequences: Iterator[tuple], min_length: int, sanitize: bool,
+               on_chunk=None) -> dict:
+    """Summarize streamed sequences, spreading large inputs across worker processes."""
+    # The stream's length is unknown, so read up to the threshold to decide
+    head = list(islice(sequences, PARALLEL_MIN_SEQUENCES))
+    sequences = chain(head, sequences)
+    workers = os.cpu_count() or 1
+    if len(head) < PARALLEL_MIN_SEQUENCES or workers < 2:
+        return summarize_sequences(sequences, min_length, sanitize, on_chunk=on_chunk)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return summarize_sequences(
+            sequences, min_length, sanitize, executor=executor, on_chunk=on_chunk
+        )
+
+
 def _display_summary(summary: dict):
     """Display validation summary in a nice table."""
     table = Table(title="Validation Summary", show_header=True)
@@ -233,15 +307,12 @@ def _save_cleaned_sequences(validation_results: List[dict], output_path: str, ve
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
+        with open(output_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
             for result in validation_results:
                 sequence = result.get('corrected_sequence') or result.get('original_sequence', '')
                 if sequence:
-                    f.write(f">{result['header']}\n")
-                    # Write sequence in lines of 60 characters
-                    for i in range(0, len(sequence), 60):
-                        f.write(sequence[i:i+60] + "\n")
-                    f.write("\n")
+                    # One write per record, with a blank line between records
+                    f.write(format_fasta_record(result['header'], sequence) + "\n")
         
         if verbose:
             console.print(f"[green]Cleaned sequences saved to: {output_path}[/green]")
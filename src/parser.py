@@ -7,16 +7,136 @@ with their corresponding headers.
 Author: noomesk
 """
 
+import bz2
+import gzip
+import io
+import queue
 import re
-from typing import List, Tuple
+import threading
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator, List, TextIO, Tuple
 from pathlib import Path
 
 
+READ_BUFFER_SIZE = 1 << 20
+FORMAT_SNIFF_LINES = 10
+
+GZIP_MAGIC = b'\x1f\x8b'
+BZIP2_MAGIC = b'BZh'
+DECOMPRESS_CHUNK_SIZE = 4 << 20
+DECOMPRESS_QUEUE_SIZE = 4
+
+FASTA_LINE_WIDTH = 60
+_FASTA_LINE_RE = re.compile(f".{{1,{FASTA_LINE_WIDTH}}}")
+
+
 class ParsingError(Exception):
     """Custom exception for parsing errors."""
     pass
 
 
+class _ThreadedReader(io.RawIOBase):
+    """Raw stream that reads ahead from ``source`` on a background thread.
+    
+    Used for compressed files: zlib and bz2 release the GIL while
+    decompressing, so the next chunks are inflated while the current one
+    is being parsed. At most ``DECOMPRESS_QUEUE_SIZE`` chunks are buffered.
+    """
+    
+    def __init__(self, source: BinaryIO, file: BinaryIO):
+        super().__init__()
+        self._source = source
+        self._file = file
+        self._queue = queue.Queue(maxsize=DECOMPRESS_QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._pending = memoryview(b'')
+        self._eof = False
+        self._error = None
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+    
+    def _fill(self) -> None:
+        end = b''
+        try:
+            while not self._stop.is_set():
+                chunk = self._source.read(DECOMPRESS_CHUNK_SIZE)
+                if not chunk:
+                    return
+                self._put(chunk)
+        except BaseException as e:
+            # Re-raised in the reading thread
+            end = e
+        finally:
+            # Always end the stream so the reader never waits on a dead thread
+            self._put(end)
+    
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        if not self._pending:
+            if self._error is not None:
+                raise self._error
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._error = item
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = memoryview(item)
+        
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+            self._file.close()
+        super().close()
+
+
+def _open_text(file_path: str) -> TextIO:
+    """Open a plain, gzip or bzip2 compressed file as UTF-8 text.
+    
+    Compression is detected from the file's magic bytes rather than its
+    extension, peeked from the same handle the content is read through;
+    compressed files are decompressed on a background thread.
+    
+    Args:
+        file_path (str): Path to the file
+        
+    Returns:
+        TextIO: Text stream over the (decompressed) content
+    """
+    f = open(file_path, 'rb', buffering=READ_BUFFER_SIZE)
+    magic = f.peek(len(BZIP2_MAGIC))[:len(BZIP2_MAGIC)]
+    
+    if magic.startswith(GZIP_MAGIC):
+        source = gzip.GzipFile(fileobj=f, mode='rb')
+    elif magic.startswith(BZIP2_MAGIC):
+        source = bz2.BZ2File(f, 'rb')
+    else:
+        return io.TextIOWrapper(f, encoding='utf-8')
+    
+    raw = io.BufferedReader(_ThreadedReader(source, f), buffer_size=READ_BUFFER_SIZE)
+    return io.TextIOWrapper(raw, encoding='utf-8')
+
+
 def _is_fasta_format(file_content: str) -> bool:
     """Check if the file content is in FASTA format.
     
@@ -53,6 +173,27 @@ def load_sequences(file_path: str) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: List of (header, sequence) tuples
         
+    Raises:
+        ParsingError: If the file format is invalid or cannot be read
+        FileNotFoundError: If the file does not exist
+    """
+    return load_sequences_with_format(file_path)[1]
+
+
+def load_sequences_with_format(file_path: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """Load sequences and report the format they were parsed as.
+    
+    The format is sniffed from the same pass that parses the file, so
+    callers that show the format don't need ``detect_file_format`` to
+    open and read the file a second time.
+    
+    Args:
+        file_path (str): Path to the FASTA/FASTQ file
+        
+    Returns:
+        Tuple[str, List[Tuple[str, str]]]: "fasta" or "fastq", and the
+            list of (header, sequence) tuples
+        
     Raises:
         ParsingError: If the file format is invalid or cannot be read
         FileNotFoundError: If the file does not exist
@@ -62,30 +203,124 @@ def load_sequences(file_path: str) -> List[Tuple[str, str]]:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            
-        if not content:
-            raise ParsingError("File is empty")
-        
-        sequences = []
+        with _open_text(file_path) as f:
+            file_format, records = _sniff_records(f)
+            sequences = list(records)
         
-        if _is_fasta_format(content):
-            sequences = _parse_fasta(content)
-        else:
-            sequences = _parse_fastq(content)
-            
         if not sequences:
             raise ParsingError("No valid sequences found in file")
             
-        return sequences
+        return file_format, sequences
         
-    except (IOError, OSError) as e:
+    except (OSError, EOFError, UnicodeDecodeError) as e:
         raise ParsingError(f"Error reading file: {str(e)}")
     except Exception as e:
         raise ParsingError(f"Unexpected error parsing file: {str(e)}")
 
 
+def iter_sequences(file_path: str) -> Iterator[Tuple[str, str]]:
+    """Stream sequences from a FASTA or FASTQ file one record at a time.
+    
+    The file is read line by line, so only the record being assembled is
+    held in memory rather than the whole file. Gzip and bzip2 compressed
+    files are supported.
+    
+    Args:
+        file_path (str): Path to the FASTA/FASTQ file
+        
+    Yields:
+        Tuple[str, str]: (header, sequence) tuples
+        
+    Raises:
+        ParsingError: If the file is empty, truncated, corrupt or not
+            valid UTF-8
+        OSError: If the file cannot be opened
+    """
+    with _open_text(file_path) as f:
+        try:
+            yield from _sniff_records(f)[1]
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            raise ParsingError(f"Error reading file: {str(e)}")
+
+
+def _sniff_records(f: TextIO) -> Tuple[str, Iterator[Tuple[str, str]]]:
+    """Detect the format of an open file and return a record iterator over it.
+    
+    The format is sniffed from the first non-blank lines, which are then
+    replayed to the parser, so the file is read only once.
+    
+    Args:
+        f (TextIO): Text stream positioned at the start of the file
+        
+    Returns:
+        Tuple[str, Iterator[Tuple[str, str]]]: "fasta" or "fastq", and an
+            iterator of (header, sequence) tuples that reads from ``f``
+        
+    Raises:
+        ParsingError: If the file is empty
+    """
+    head = []
+    for line in f:
+        if head or line.strip():
+            head.append(line)
+            if len(head) == FORMAT_SNIFF_LINES:
+                break
+    
+    if not head:
+        raise ParsingError("File is empty")
+    
+    lines = chain(head, f)
+    if _is_fasta_format(''.join(head)):
+        return "fasta", _iter_fasta(lines)
+    return "fastq", _iter_fastq(lines)
+
+
+def load_sequences_from_bytes(data: bytes) -> List[Tuple[str, str]]:
+    """Parse sequences from raw FASTA or FASTQ file content.
+    
+    Args:
+        data (bytes): File content, e.g. from an upload
+        
+    Returns:
+        List[Tuple[str, str]]: List of (header, sequence) tuples
+        
+    Raises:
+        ParsingError: If the content cannot be decoded or parsed
+    """
+    try:
+        content = data.decode('utf-8').strip()
+    except UnicodeDecodeError as e:
+        raise ParsingError(f"Error decoding file: {str(e)}")
+    
+    return _parse_content(content)
+
+
+def _parse_content(content: str) -> List[Tuple[str, str]]:
+    """Parse stripped FASTA or FASTQ content, detecting the format.
+    
+    Args:
+        content (str): File content
+        
+    Returns:
+        List[Tuple[str, str]]: List of (header, sequence) tuples
+        
+    Raises:
+        ParsingError: If the content is empty or has no sequences
+    """
+    if not content:
+        raise ParsingError("File is empty")
+    
+    if _is_fasta_format(content):
+        sequences = _parse_fasta(content)
+    else:
+        sequences = _parse_fastq(content)
+        
+    if not sequences:
+        raise ParsingError("No valid sequences found in file")
+        
+    return sequences
+
+
 def _parse_fasta(content: str) -> List[Tuple[str, str]]:
     """Parse FASTA format content.
     
@@ -95,36 +330,47 @@ def _parse_fasta(content: str) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: List of (header, sequence) tuples
     """
-    sequences = []
-    lines = content.strip().split('\n')
+    return list(_iter_fasta(io.StringIO(content)))
+
+
+def _iter_fasta(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (header, sequence) tuples from FASTA lines.
+    
+    Args:
+        lines (Iterable[str]): FASTA lines, with or without line endings
+        
+    Yields:
+        Tuple[str, str]: (header, sequence) tuples
+    """
     current_header = None
     current_sequence = []
+    append = current_sequence.append
     
     for line in lines:
         line = line.strip()
         if not line:
             continue
             
-        if line.startswith('>'):
-            # Save previous sequence if exists
+        if line[0] == '>':
+            # Emit previous sequence if exists
             if current_header is not None:
                 sequence = ''.join(current_sequence)
-                if sequence:  # Only add if sequence is not empty
-                    sequences.append((current_header, sequence))
+                if sequence:  # Only emit if sequence is not empty
+                    yield (current_header, sequence)
             
-            current_header = line[1:].strip()  # Remove '>' prefix
+            # Remove '>' prefix; the line's trailing whitespace is already stripped
+            current_header = line[1:].lstrip()
             current_sequence = []
+            append = current_sequence.append
         else:
             # Sequence line
-            current_sequence.append(line)
+            append(line)
     
-    # Add the last sequence
+    # Emit the last sequence
     if current_header is not None:
         sequence = ''.join(current_sequence)
         if sequence:
-            sequences.append((current_header, sequence))
-    
-    return sequences
+            yield (current_header, sequence)
 
 
 def _parse_fastq(content: str) -> List[Tuple[str, str]]:
@@ -136,36 +382,42 @@ def _parse_fastq(content: str) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: List of (header, sequence) tuples
     """
-    sequences = []
-    lines = content.strip().split('\n')
-    i = 0
+    return list(_iter_fastq(io.StringIO(content)))
+
+
+def _iter_fastq(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (header, sequence) tuples from FASTQ lines.
     
-    while i < len(lines):
-        line = lines[i].strip()
+    Args:
+        lines (Iterable[str]): FASTQ lines, with or without line endings
         
-        # FASTQ records start with '@'
-        if line.startswith('@'):
-            header = line[1:].strip()  # Remove '@' prefix
-            
-            # Next line should be the sequence
-            if i + 1 < len(lines):
-                sequence = lines[i + 1].strip()
-                
-                # Skip quality line and separator if they exist
-                if i + 3 < len(lines):
-                    i += 4  # Move past @header, sequence, +, quality
-                else:
-                    i += 2  # Move past header and sequence only
-                
-                if sequence:  # Only add if sequence is not empty
-                    sequences.append((header, sequence))
-            else:
-                # Incomplete record, skip
-                i += 1
-        else:
-            i += 1
+    Yields:
+        Tuple[str, str]: (header, sequence) tuples
+    """
+    lines = iter(lines)
     
-    return sequences
+    for line in lines:
+        line = line.strip()
+        
+        # FASTQ records start with '@'
+        if line[:1] != '@':
+            continue
+        
+        header = line[1:].lstrip()  # Remove '@' prefix
+        
+        # Next line should be the sequence
+        sequence = next(lines, None)
+        if sequence is None:
+            # Incomplete record, skip
+            return
+        sequence = sequence.strip()
+        
+        # Skip separator and quality line if they exist
+        next(lines, None)
+        next(lines, None)
+        
+        if sequence:  # Only add if sequence is not empty
+            yield (header, sequence)
 
 
 def detect_file_format(file_path: str) -> str:
@@ -182,7 +434,7 @@ def detect_file_format(file_path: str) -> str:
         if not path.exists():
             return "unknown"
         
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with _open_text(file_path) as f:
             # Read first few lines to detect format
             lines = []
             for _ in range(10):
@@ -210,3 +462,18 @@ def detect_file_format(file_path: str) -> str:
         
     except Exception:
         return "unknown"
+
+
+def format_fasta_record(header: str, sequence: str) -> str:
+    """Format a sequence as a FASTA record.
+    
+    Args:
+        header (str): Sequence header, without the leading '>'
+        sequence (str): DNA sequence
+        
+    Returns:
+        str: The record, with the sequence in lines of ``FASTA_LINE_WIDTH``
+            characters and a trailing newline
+    """
+    lines = "\n".join(_FASTA_LINE_RE.findall(sequence))
+    return f">{header}\n{lines}\n"
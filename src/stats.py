@@ -9,33 +9,50 @@ Author: noomesk
 
 import json
 import csv
-from typing import Dict, List, Tuple
+import heapq
+from typing import Dict, List, Sequence
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+import numpy as np
 
-def generate_report(validation_results: List[Dict]) -> Dict:
+try:
+    import orjson
+except ImportError:  # optional, speeds up saving large JSON reports
+    orjson = None
+
+from .validator import ERROR_TYPES, QUALITY_LEVELS, count_bases, error_code, error_codes, is_sanitized, quality_level
+
+
+def generate_report(validation_results: List[Dict], details: bool = True) -> Dict:
     """Generate comprehensive statistical report from validation results.
     
     Args:
         validation_results (List[Dict]): List of validation results from validator
+        details (bool): If False, leave out the per-sequence sections
+            (``invalid_sequences_detail`` and ``sequence_statistics``) so
+            memory does not grow with the number of sequences
         
     Returns:
         Dict: Comprehensive report containing all statistics
     """
     if not validation_results:
-        return _empty_report()
+        return _empty_report(details)
     
-    # Basic counts
+    # Basic counts, all gathered in the single pass below
     total_seqs = len(validation_results)
-    valid_seqs = sum(1 for result in validation_results if result["is_valid"])
-    invalid_seqs = total_seqs - valid_seqs
+    valid_seqs = 0
     sanitized_seqs = 0
     duplicate_headers = 0
+    quality_counts = dict.fromkeys(QUALITY_LEVELS, 0)
     
-    # Length statistics
-    lengths = []
-    gc_contents = []
+    # Length statistics, filled for each result that has a sequence
+    lengths = np.empty(total_seqs, dtype=np.int64)
+    gc_contents = np.empty(total_seqs, dtype=np.float64)
+    stats_indices = np.empty(total_seqs, dtype=np.int64)
+    stats_count = 0
     sequence_stats = []
     
     # Error tracking
@@ -43,81 +60,104 @@ def generate_report(validation_results: List[Dict]) -> Dict:
     invalid_sequences = []
     
     for i, result in enumerate(validation_results):
+        # Look up the fields used below once per result
+        corrected = result.get("corrected_sequence")
+        original = result.get("original_sequence", "")
+        errors = result["errors"]
+        codes = error_codes(result)
+        header = result["header"]
+        is_valid = result["is_valid"]
+        
+        valid_seqs += is_valid
+        # Validator results carry their level; hand-built results are classified here
+        quality = result.get("quality") or quality_level(result)
+        if quality in quality_counts:
+            quality_counts[quality] += 1
+        
         # Track sanitization
-        if (result.get("corrected_sequence") and 
-            result.get("corrected_sequence") != result.get("original_sequence", "")):
+        if is_sanitized(result):
             sanitized_seqs += 1
         
         # Track duplicates
-        if any("Duplicate header" in error for error in result["errors"]):
+        if "duplicate_header" in codes:
             duplicate_headers += 1
         
         # Get sequence for statistics
-        sequence = result.get("corrected_sequence") or result.get("original_sequence", "")
+        sequence = corrected or original
         
         if sequence:
-            lengths.append(len(sequence))
+            lengths[stats_count] = len(sequence)
             
-            # Calculate GC content directly to avoid circular import
-            seq_upper = sequence.upper()
-            gc_count = seq_upper.count('G') + seq_upper.count('C')
-            at_count = seq_upper.count('A') + seq_upper.count('T')
-            valid_bases = gc_count + at_count
+            # Count bases once and derive GC content from the counts
+            a_count, t_count, g_count, c_count, n_count = count_bases(sequence)
+            gc_count = g_count + c_count
+            valid_bases = gc_count + a_count + t_count
             
             if valid_bases > 0:
                 gc_content = (gc_count / valid_bases) * 100
             else:
                 gc_content = 0.0
                 
-            gc_contents.append(gc_content)
+            gc_contents[stats_count] = gc_content
+            stats_indices[stats_count] = i
+            stats_count += 1
             
             # Calculate sequence stats directly
-            stats = {
-                "length": len(seq_upper),
-                "gc_content": gc_content,
-                "a_count": seq_upper.count('A'),
-                "t_count": seq_upper.count('T'),
-                "g_count": seq_upper.count('G'),
-                "c_count": seq_upper.count('C'),
-                "n_count": seq_upper.count('N'),
-                "valid_chars": seq_upper.count('A') + seq_upper.count('T') + 
-                              seq_upper.count('G') + seq_upper.count('C')
-            }
-            
-            stats["sequence_index"] = i
-            stats["header"] = result["header"]
-            stats["is_valid"] = result["is_valid"]
-            sequence_stats.append(stats)
+            if details:
+                sequence_stats.append({
+                    "length": len(sequence),
+                    "gc_content": gc_content,
+                    "a_count": a_count,
+                    "t_count": t_count,
+                    "g_count": g_count,
+                    "c_count": c_count,
+                    "n_count": n_count,
+                    "valid_chars": valid_bases,
+                    "sequence_index": i,
+                    "header": header,
+                    "is_valid": is_valid
+                })
         
         # Track errors
-        if not result["is_valid"]:
-            invalid_sequences.append({
-                "index": i,
-                "header": result["header"],
-                "errors": result["errors"],
-                "warnings": result["warnings"],
-                "length": result.get("original_length", 0)
-            })
+        if not is_valid:
+            if details:
+                invalid_sequences.append({
+                    "index": i,
+                    "header": header,
+                    "errors": errors,
+                    "warnings": result["warnings"],
+                    "length": result.get("original_length", 0)
+                })
             
             error_details.extend([{
                 "sequence_index": i,
-                "header": result["header"],
+                "header": header,
                 "error": error,
-                "error_type": _classify_error(error)
-            } for error in result["errors"]])
+                "error_type": ERROR_TYPES[code]
+            } for error, code in zip(errors, codes)])
     
     # Calculate length statistics
-    length_stats = _calculate_length_stats(lengths) if lengths else {}
-    gc_stats = _calculate_gc_stats(gc_contents) if gc_contents else {}
+    length_stats = _calculate_length_stats(lengths[:stats_count])
+    gc_stats = _calculate_gc_stats(gc_contents[:stats_count])
     
-    # Top 10 longest sequences
-    top_10_longest = _get_top_10_longest(sequence_stats)
+    # Top 10 longest sequences; without per-sequence stats, pick the rows
+    # from the arrays first and build entries for those only
+    if details:
+        top_10_longest = _get_top_10_longest(sequence_stats)
+    else:
+        length_list = lengths[:stats_count].tolist()
+        longest_rows = heapq.nlargest(10, range(stats_count), key=length_list.__getitem__)
+        top_10_longest = _get_top_10_longest([{
+            "length": length_list[k],
+            "gc_content": float(gc_contents[k]),
+            "sequence_index": int(stats_indices[k]),
+            "header": validation_results[stats_indices[k]]["header"]
+        } for k in longest_rows])
     
     # Error analysis
     error_analysis = _analyze_errors(error_details)
     
-    # Quality distribution
-    quality_distribution = _calculate_quality_distribution(validation_results)
+    invalid_seqs = total_seqs - valid_seqs
     
     # Generate final report
     report = {
@@ -138,12 +178,14 @@ def generate_report(validation_results: List[Dict]) -> Dict:
         "sequence_lengths": length_stats,
         "gc_content": gc_stats,
         "top_10_longest": top_10_longest,
-        "quality_distribution": quality_distribution,
-        "error_analysis": error_analysis,
-        "invalid_sequences_detail": invalid_sequences,
-        "sequence_statistics": sequence_stats
+        "quality_distribution": quality_counts,
+        "error_analysis": error_analysis
     }
     
+    if details:
+        report["invalid_sequences_detail"] = invalid_sequences
+        report["sequence_statistics"] = sequence_stats
+    
     return report
 
 
@@ -178,9 +220,9 @@ def save_report(report: Dict, format: str, output_path: str = None) -> str:
         raise IOError(f"Error saving report: {str(e)}")
 
 
-def _empty_report() -> Dict:
+def _empty_report(details: bool = True) -> Dict:
     """Generate an empty report structure."""
-    return {
+    report = {
         "metadata": {
             "generated_at": datetime.now().isoformat(),
             "total_sequences": 0,
@@ -199,61 +241,78 @@ def _empty_report() -> Dict:
         "gc_content": {},
         "top_10_longest": [],
         "quality_distribution": {},
-        "error_analysis": {},
-        "invalid_sequences_detail": [],
-        "sequence_statistics": []
+        "error_analysis": {}
     }
+    
+    if details:
+        report["invalid_sequences_detail"] = []
+        report["sequence_statistics"] = []
+    
+    return report
 
 
-def _calculate_length_stats(lengths: List[int]) -> Dict:
+def _calculate_length_stats(lengths: Sequence[int]) -> Dict:
     """Calculate statistics for sequence lengths."""
-    if not lengths:
+    values = np.asarray(lengths, dtype=np.int64)
+    if not values.size:
         return {}
     
+    total = int(values.sum())
+    quartiles = _calculate_quartiles(values)
+    
     return {
-        "min": min(lengths),
-        "max": max(lengths),
-        "mean": sum(lengths) / len(lengths),
-        "median": sorted(lengths)[len(lengths) // 2],
-        "total": sum(lengths),
-        "count": len(lengths),
-        "quartiles": _calculate_quartiles(lengths)
+        "min": int(values.min()),
+        "max": int(values.max()),
+        "mean": total / values.size,
+        "median": quartiles["q2"],
+        "total": total,
+        "count": values.size,
+        "quartiles": quartiles
     }
 
 
-def _calculate_gc_stats(gc_contents: List[float]) -> Dict:
+def _calculate_gc_stats(gc_contents: Sequence[float]) -> Dict:
     """Calculate statistics for GC content."""
-    if not gc_contents:
+    values = np.asarray(gc_contents, dtype=np.float64)
+    if not values.size:
         return {}
     
+    middle = values.size // 2
+    
     return {
-        "min": min(gc_contents),
-        "max": max(gc_contents),
-        "mean": sum(gc_contents) / len(gc_contents),
-        "median": sorted(gc_contents)[len(gc_contents) // 2],
-        "count": len(gc_contents)
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+        "median": float(np.partition(values, middle)[middle]),
+        "count": values.size
     }
 
 
-def _calculate_quartiles(values: List[int]) -> Dict:
+def _calculate_quartiles(values: Sequence[int]) -> Dict:
     """Calculate quartile statistics."""
-    sorted_values = sorted(values)
-    n = len(sorted_values)
+    values = np.asarray(values)
+    n = len(values)
+    if n == 0:
+        return {"q1": 0, "q2": 0, "q3": 0}
+    
+    # Same order statistics as indexing the sorted values, without a full sort
+    positions = [n // 4, n // 2, 3 * n // 4]
+    q1, q2, q3 = np.partition(values, positions)[positions].tolist()
     
     return {
-        "q1": sorted_values[n // 4] if n > 0 else 0,
-        "q2": sorted_values[n // 2] if n > 0 else 0,  # median
-        "q3": sorted_values[3 * n // 4] if n > 0 else 0
+        "q1": q1,
+        "q2": q2,  # median
+        "q3": q3
     }
 
 
 def _get_top_10_longest(sequence_stats: List[Dict]) -> List[Dict]:
     """Get top 10 longest sequences."""
-    # Sort by length descending
-    sorted_stats = sorted(sequence_stats, key=lambda x: x.get("length", 0), reverse=True)
+    # Same order as sorting by length descending, without sorting everything
+    longest = heapq.nlargest(10, sequence_stats, key=itemgetter("length"))
     
     top_10 = []
-    for i, stats in enumerate(sorted_stats[:10]):
+    for i, stats in enumerate(longest):
         top_10.append({
             "rank": i + 1,
             "header": stats["header"],
@@ -267,16 +326,7 @@ def _get_top_10_longest(sequence_stats: List[Dict]) -> List[Dict]:
 
 def _classify_error(error: str) -> str:
     """Classify error type based on error message."""
-    if "Invalid characters" in error:
-        return "Invalid characters"
-    elif "too short" in error:
-        return "Too short"
-    elif "Duplicate header" in error:
-        return "Duplicate header"
-    elif "Empty sequence" in error:
-        return "Empty sequence"
-    else:
-        return "Other"
+    return ERROR_TYPES[error_code(error)]
 
 
 def _analyze_errors(error_details: List[Dict]) -> Dict:
@@ -288,55 +338,27 @@ def _analyze_errors(error_details: List[Dict]) -> Dict:
             "most_common_error": None
         }
     
-    error_types = {}
-    for error_detail in error_details:
-        error_type = error_detail["error_type"]
-        error_types[error_type] = error_types.get(error_type, 0) + 1
+    error_types = Counter(map(itemgetter("error_type"), error_details))
     
-    most_common = max(error_types.items(), key=lambda x: x[1]) if error_types else None
+    # Ties go to the type seen first, as with max()
+    most_common = error_types.most_common(1)[0] if error_types else None
     
     return {
         "total_errors": len(error_details),
-        "error_types": error_types,
+        "error_types": dict(error_types),
         "most_common_error": most_common[0] if most_common else None,
         "most_common_count": most_common[1] if most_common else 0
     }
 
 
-def _calculate_quality_distribution(validation_results: List[Dict]) -> Dict:
-    """Calculate distribution of sequence quality levels."""
-    if not validation_results:
-        return {}
-    
-    quality_levels = {
-        "high_quality": 0,  # valid, long, no warnings
-        "medium_quality": 0,  # valid with warnings
-        "low_quality": 0,  # invalid but can be sanitized
-        "unusable": 0  # invalid and cannot be fixed
-    }
-    
-    for result in validation_results:
-        has_errors = len(result["errors"]) > 0
-        has_warnings = len(result["warnings"]) > 0
-        
-        if not has_errors:
-            if not has_warnings:
-                quality_levels["high_quality"] += 1
-            else:
-                quality_levels["medium_quality"] += 1
-        else:
-            # Check if errors can be fixed by sanitization
-            can_be_sanitized = any("Invalid characters" in error for error in result["errors"])
-            if can_be_sanitized:
-                quality_levels["low_quality"] += 1
-            else:
-                quality_levels["unusable"] += 1
-    
-    return quality_levels
-
-
 def _save_json_report(report: Dict, filename: str) -> None:
     """Save report as JSON file."""
+    if orjson is not None:
+        # orjson writes UTF-8 directly, like ensure_ascii=False below
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        return
+    
     with open(filename, 'w', encoding='utf-8') as f:
         json.dump(report, f, indent=2, ensure_ascii=False)
 
@@ -7,9 +7,72 @@ and clean/sanitize sequences when requested.
 Author: noomesk
 """
 
+import gc
 import re
-from typing import Dict, List, Optional, Set
-from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from collections import Counter, deque
+from concurrent.futures import Executor
+from itertools import islice, repeat
+from operator import itemgetter
+
+import numpy as np
+
+
+QUALITY_LEVELS = [
+    "high_quality",  # valid, long, no warnings
+    "medium_quality",  # valid with warnings
+    "low_quality",  # invalid but can be sanitized
+    "unusable"  # invalid and cannot be fixed
+]
+
+# Shorter sequences are cheaper to count with str.count than with np.bincount
+BINCOUNT_MIN_LENGTH = 2048
+BINCOUNT_CHUNK_SIZE = 1 << 16
+_BASES = "ATGCN"
+_BASE_BYTES = [ord(base) for base in _BASES]
+_LOWER_BASE_BYTES = [ord(base.lower()) for base in _BASES]
+
+# Byte tables for validating ASCII sequences with bytes.translate
+_VALID_BASES = b"ACGTN"
+_WHITESPACE = b" \t\n"
+_UPPER_TABLE = bytes(range(256)).upper()
+_SANITIZE_TABLE = bytes(byte if byte in _VALID_BASES else ord('N') for byte in range(256))
+# Validate and sanitize non-ASCII sequences, which the byte tables cannot handle
+_VALID_BASE_CHARS = frozenset("ACGTN")
+_INVALID_BASE_RE = re.compile(r'[^ACGTN]')
+# Shorter sequences are cheaper to scan with set() than with bytes.translate
+TRANSLATE_MIN_LENGTH = 256
+
+# Sequences shorter than this are validated together by _validate_chunk
+BATCH_MAX_LENGTH = 1024
+# Sequences counted per vectorized pass; bounds the temporary arrays, which
+# take about 2 KB per sequence plus 8 bytes per base
+BATCH_MAX_SEQUENCES = 2000
+# Histogram columns read by _validate_chunk: ACGTN, then acgtn
+_BATCH_COLUMNS = list(b"ACGTNacgtn")
+
+LOW_COMPLEXITY_MIN_LENGTH = 10
+LOW_COMPLEXITY_MIN_UNIQUE_CHARS = 4
+LOW_COMPLEXITY_MIN_UNIQUE_RATIO = 0.3
+
+_ALL_N_WARNING = "Sequence contains only N characters (likely low quality)"
+_LOW_COMPLEXITY_WARNING = "Low complexity sequence detected"
+
+# Below this, starting worker processes costs more than it saves
+PARALLEL_MIN_SEQUENCES = 10_000
+
+# Chunks submitted ahead of the one being consumed when summarizing a stream
+MAX_PENDING_CHUNKS = 16
+
+# Error codes recorded in ``error_codes`` alongside each message in ``errors``
+ERROR_TYPES = {
+    "empty_sequence": "Empty sequence",
+    "invalid_characters": "Invalid characters",
+    "too_short": "Too short",
+    "duplicate_header": "Duplicate header",
+    "other": "Other"
+}
 
 
 def validate_sequence(header: str, sequence: str, min_length: int = 20, sanitize: bool = False) -> Dict:
@@ -25,67 +88,92 @@ def validate_sequence(header: str, sequence: str, min_length: int = 20, sanitize
         Dict: Validation result containing:
             - is_valid (bool): Whether sequence passed all validations
             - errors (List[str]): List of validation errors
+            - error_codes (List[str]): ``ERROR_TYPES`` code for each error
             - corrected_sequence (str): Sanitized sequence (if sanitize=True)
+            - sanitized (bool): Whether sanitizing changed the sequence
             - warnings (List[str]): List of warnings
     """
-    result = {
-        "is_valid": True,
-        "errors": [],
-        "warnings": [],
-        "corrected_sequence": sequence if sanitize else None,
-        "header": header,
-        "original_length": len(sequence),
-        "corrected_length": len(sequence) if sanitize else None
-    }
+    original_length = len(sequence)
     
     # Check for empty sequence
     if not sequence.strip():
-        result["is_valid"] = False
-        result["errors"].append("Empty sequence")
-        return result
+        return {
+            "is_valid": False,
+            "errors": ["Empty sequence"],
+            "error_codes": ["empty_sequence"],
+            "warnings": [],
+            "corrected_sequence": sequence if sanitize else None,
+            "header": header,
+            "original_length": original_length,
+            "corrected_length": original_length if sanitize else None,
+            "sanitized": False
+        }
     
     # Convert to uppercase for processing
-    seq_upper = sequence.upper().replace(" ", "").replace("\t", "").replace("\n", "")
-    
-    # Check for invalid characters
-    valid_chars_pattern = r'^[ACGTN]*$'  # Only A, C, G, T, N allowed
-    invalid_chars = []
-    
-    if not re.match(valid_chars_pattern, seq_upper):
-        # Find which characters are invalid
-        for char in seq_upper:
-            if char not in 'ACGTN':
-                invalid_chars.append(char)
+    if sequence.isascii():
+        # bytes.translate applies a 256-entry table in one C pass, so the
+        # upper-casing and whitespace removal share a single copy, and the
+        # validity check and sanitizing need no regex or per-character loop
+        seq_bytes = sequence.encode('ascii').translate(_UPPER_TABLE, _WHITESPACE)
+        seq_upper = seq_bytes.decode('ascii')
+        invalid_chars = set(seq_bytes.translate(None, _VALID_BASES).decode('ascii'))
+    else:
+        seq_bytes = None
+        seq_upper = sequence.upper().replace(" ", "").replace("\t", "").replace("\n", "")
+        invalid_chars = set(seq_upper) - _VALID_BASE_CHARS
+    
+    # Collect the outcome in locals and build the result dict once at the end
+    errors = []
+    codes = []
+    warnings = []
+    corrected_length = original_length if sanitize else None
+    
+    # Check for invalid characters; only A, C, G, T, N are allowed
+    if invalid_chars:
+        errors.append(f"Invalid characters found: {', '.join(sorted(invalid_chars))}")
+        codes.append("invalid_characters")
         
-        if invalid_chars:
-            error_msg = f"Invalid characters found: {', '.join(set(invalid_chars))}"
-            result["errors"].append(error_msg)
-            result["is_valid"] = False
-            
-            if sanitize:
-                # Remove invalid characters and replace with 'N'
-                corrected = re.sub(r'[^ACGTN]', 'N', seq_upper)
-                result["corrected_sequence"] = corrected
-                result["corrected_length"] = len(corrected)
+        corrected = None
+        if sanitize:
+            # Replace invalid characters with 'N'
+            if seq_bytes is not None:
+                corrected = seq_bytes.translate(_SANITIZE_TABLE).decode('ascii')
+            else:
+                corrected = _INVALID_BASE_RE.sub('N', seq_upper)
+            corrected_length = len(corrected)
     else:
-        result["corrected_sequence"] = seq_upper if sanitize else sequence
+        corrected = seq_upper if sanitize else sequence
     
     # Check minimum length
-    final_sequence = result["corrected_sequence"] if sanitize else seq_upper
+    final_sequence = corrected if sanitize else seq_upper
     if len(final_sequence) < min_length:
-        error_msg = f"Sequence too short: {len(final_sequence)} bp (minimum: {min_length} bp)"
-        result["errors"].append(error_msg)
-        result["is_valid"] = False
+        errors.append(_too_short_error(len(final_sequence), min_length))
+        codes.append("too_short")
     
     # Check for sequences with only N's (likely low quality)
-    if final_sequence and all(char == 'N' for char in final_sequence):
-        result["warnings"].append("Sequence contains only N characters (likely low quality)")
+    if final_sequence.startswith('N') and final_sequence.count('N') == len(final_sequence):
+        warnings.append(_ALL_N_WARNING)
     
     # Check for very low complexity (repetitive sequences)
     if _is_low_complexity(final_sequence):
-        result["warnings"].append("Low complexity sequence detected")
+        warnings.append(_LOW_COMPLEXITY_WARNING)
     
-    return result
+    return {
+        "is_valid": not errors,
+        "errors": errors,
+        "error_codes": codes,
+        "warnings": warnings,
+        "corrected_sequence": corrected,
+        "header": header,
+        "original_length": original_length,
+        "corrected_length": corrected_length,
+        "sanitized": sanitize and corrected != sequence
+    }
+
+
+def _too_short_error(length: int, min_length: int) -> str:
+    """Format the error message for a sequence below the minimum length."""
+    return f"Sequence too short: {length} bp (minimum: {min_length} bp)"
 
 
 def validate_sequences(sequences: List[tuple], min_length: int = 20, sanitize: bool = False) -> List[Dict]:
@@ -99,49 +187,271 @@ def validate_sequences(sequences: List[tuple], min_length: int = 20, sanitize: b
     Returns:
         List[Dict]: List of validation results for each sequence
     """
-    # First pass: collect all headers to detect duplicates
-    headers = [seq[0] for seq in sequences]
-    header_counts = Counter(headers)
-    duplicate_headers = {header for header, count in header_counts.items() if count > 1}
+    results = _validate_chunk(sequences, min_length, sanitize)
+    return _add_batch_checks(sequences, results)
+
+
+def validate_sequences_parallel(sequences: List[tuple], min_length: int = 20, sanitize: bool = False,
+                                executor: Optional[Executor] = None, chunk_size: int = 2000,
+                                on_chunk: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
+    """Validate multiple sequences in parallel chunks.
+    
+    Per-sequence checks run on ``executor``; duplicate-header detection
+    needs the whole batch and runs afterwards in the calling process, so
+    the results are identical to ``validate_sequences``.
+    
+    Args:
+        sequences (List[tuple]): List of (header, sequence) tuples
+        min_length (int): Minimum acceptable sequence length
+        sanitize (bool): If True, attempt to clean invalid characters
+        executor (Executor, optional): Pool to run chunks on; validates
+            serially when not given
+        chunk_size (int): Number of sequences per chunk
+        on_chunk (Callable, optional): Called in order with each chunk's
+            results as it completes, before duplicate headers are checked
+        
+    Returns:
+        List[Dict]: List of validation results for each sequence
+    """
+    chunks = [sequences[i:i + chunk_size] for i in range(0, len(sequences), chunk_size)]
+    mapper = executor.map if executor is not None else map
     
     results = []
+    # map() yields chunk results in submission order
+    for chunk_results in mapper(_validate_chunk, chunks, repeat(min_length), repeat(sanitize)):
+        results.extend(chunk_results)
+        if on_chunk is not None:
+            on_chunk(chunk_results)
     
-    for i, (header, sequence) in enumerate(sequences):
-        result = validate_sequence(header, sequence, min_length, sanitize)
+    return _add_batch_checks(sequences, results)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector while building many results.
+    
+    Result dicts and their lists never form reference cycles, but every
+    one of them counts towards the collector's allocation threshold, and
+    each collection rescans the results built so far; on large batches
+    that repeated scanning costs as much as the validation itself.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _validate_chunk(sequences: List[tuple], min_length: int, sanitize: bool) -> List[Dict]:
+    """Run the per-sequence checks on a list of (header, sequence) tuples.
+    
+    For short reads the cost is per-call overhead rather than scanning, so
+    the bases of every sequence shorter than ``BATCH_MAX_LENGTH`` are
+    counted together in one vectorized pass. Sequences that contain only
+    ACGTN in either case get their result built straight from the counts;
+    the rest (and any chunk with non-ASCII text) go through
+    ``validate_sequence``. Results are the same either way.
+    
+    The counting runs over slices of ``BATCH_MAX_SEQUENCES`` so memory
+    stays flat however many sequences are passed in. The cyclic GC is
+    paused for one slice at a time, never across the slices or while
+    callers wait on executors or run callbacks.
+    """
+    results = []
+    for start in range(0, len(sequences), BATCH_MAX_SEQUENCES):
+        with _gc_paused():
+            results.extend(_validate_batch(sequences[start:start + BATCH_MAX_SEQUENCES], min_length, sanitize))
+    return results
+
+
+def _validate_batch(sequences: List[tuple], min_length: int, sanitize: bool) -> List[Dict]:
+    """Validate one slice of ``_validate_chunk``'s input with a single base count."""
+    n = len(sequences)
+    batched = [sequence if len(sequence) < BATCH_MAX_LENGTH else "" for _, sequence in sequences]
+    joined = "".join(batched)
+    if not joined.isascii():
+        return [validate_sequence(header, sequence, min_length, sanitize) for header, sequence in sequences]
+    
+    # One 256-bin byte histogram per sequence, from a single bincount
+    lengths = np.fromiter(map(len, batched), dtype=np.int64, count=n)
+    bins = np.repeat(np.arange(0, n * 256, 256, dtype=np.int64), lengths)
+    bins += np.frombuffer(joined.encode('ascii'), dtype=np.uint8)
+    counts = np.bincount(bins, minlength=n * 256).reshape(n, 256)[:, _BATCH_COLUMNS]
+    
+    base_counts = counts[:, :5] + counts[:, 5:]
+    unique_bases = np.count_nonzero(base_counts, axis=1)
+    clean = (counts.sum(axis=1) == lengths) & (lengths > 0)
+    has_lower = counts[:, 5:].any(axis=1)
+    only_n = base_counts[:, 4] == lengths
+    low_complexity = (lengths >= LOW_COMPLEXITY_MIN_LENGTH) & (
+        (unique_bases < LOW_COMPLEXITY_MIN_UNIQUE_CHARS)
+        | (unique_bases / np.maximum(lengths, 1) < LOW_COMPLEXITY_MIN_UNIQUE_RATIO)
+    )
+    
+    results = []
+    for (header, sequence), is_clean, lower, all_n, low in zip(
+            sequences, clean.tolist(), has_lower.tolist(), only_n.tolist(), low_complexity.tolist()):
+        if not is_clean:
+            results.append(validate_sequence(header, sequence, min_length, sanitize))
+            continue
         
+        # Same fields, in the same order, as validate_sequence for a
+        # sequence with no invalid characters
+        length = len(sequence)
+        result = {
+            "is_valid": True,
+            "errors": [],
+            "error_codes": [],
+            "warnings": [],
+            "corrected_sequence": (sequence.upper() if lower else sequence) if sanitize else sequence,
+            "header": header,
+            "original_length": length,
+            "corrected_length": length if sanitize else None,
+            "sanitized": sanitize and lower
+        }
+        if length < min_length:
+            result["errors"].append(_too_short_error(length, min_length))
+            result["error_codes"].append("too_short")
+            result["is_valid"] = False
+        if all_n:
+            result["warnings"].append(_ALL_N_WARNING)
+        if low:
+            result["warnings"].append(_LOW_COMPLEXITY_WARNING)
+        results.append(result)
+    
+    return results
+
+
+def _add_batch_checks(sequences: List[tuple], results: List[Dict]) -> List[Dict]:
+    """Add duplicate-header errors, sequence indices and quality levels to per-sequence results."""
+    # First pass: count every header to detect duplicates
+    header_counts = Counter(map(itemgetter(0), sequences))
+    
+    for i, ((header, _), result) in enumerate(zip(sequences, results)):
         # Add duplicate header check
-        if header in duplicate_headers:
-            duplicate_count = header_counts[header]
+        duplicate_count = header_counts[header]
+        if duplicate_count > 1:
             error_msg = f"Duplicate header found ({duplicate_count} occurrences)"
             result["errors"].append(error_msg)
+            result["error_codes"].append("duplicate_header")
             result["is_valid"] = False
         
         # Add sequence index for reference
         result["sequence_index"] = i
-        
-        results.append(result)
+        result["quality"] = quality_level(result)
     
     return results
 
 
-def _is_low_complexity(sequence: str, min_unique_chars: int = 4, min_unique_ratio: float = 0.3) -> bool:
+def quality_level(result: Dict) -> str:
+    """Classify a validation result into one of ``QUALITY_LEVELS``.
+    
+    Args:
+        result (Dict): Validation result with ``errors`` and ``warnings``
+        
+    Returns:
+        str: Quality level name
+    """
+    if result["errors"]:
+        if "invalid_characters" in error_codes(result):
+            return "low_quality"
+        return "unusable"
+    return "medium_quality" if result["warnings"] else "high_quality"
+
+
+def error_codes(result: Dict) -> List[str]:
+    """Return the ``ERROR_TYPES`` code for each error of a validation result.
+    
+    Results from ``validate_sequence`` carry their codes; for results built
+    elsewhere the codes are derived from the error messages.
+    
+    Args:
+        result (Dict): Validation result with ``errors``
+        
+    Returns:
+        List[str]: Error codes, in the same order as ``result["errors"]``
+    """
+    codes = result.get("error_codes")
+    if codes is None:
+        codes = [error_code(error) for error in result["errors"]]
+    return codes
+
+
+def error_code(error: str) -> str:
+    """Classify an error message into an ``ERROR_TYPES`` code.
+    
+    Args:
+        error (str): Error message from a validation result
+        
+    Returns:
+        str: Error code, ``"other"`` if the message is not recognized
+    """
+    if "Invalid characters" in error:
+        return "invalid_characters"
+    elif "too short" in error:
+        return "too_short"
+    elif "Duplicate header" in error:
+        return "duplicate_header"
+    elif "Empty sequence" in error:
+        return "empty_sequence"
+    else:
+        return "other"
+
+
+def _is_low_complexity(sequence: str, min_unique_chars: int = LOW_COMPLEXITY_MIN_UNIQUE_CHARS,
+                       min_unique_ratio: float = LOW_COMPLEXITY_MIN_UNIQUE_RATIO) -> bool:
     """Check if a sequence has low complexity (repetitive).
     
     Args:
-        sequence (str): DNA sequence
+        sequence (str): Upper-cased DNA sequence, as prepared by
+            ``validate_sequence``
         min_unique_chars (int): Minimum number of unique characters
         min_unique_ratio (float): Minimum ratio of unique to total characters
         
     Returns:
         bool: True if sequence appears to have low complexity
     """
-    if len(sequence) < 10:  # Skip very short sequences
+    if len(sequence) < LOW_COMPLEXITY_MIN_LENGTH:  # Skip very short sequences
         return False
     
-    unique_chars = set(sequence.upper())
-    unique_ratio = len(unique_chars) / len(sequence)
+    if len(sequence) >= TRANSLATE_MIN_LENGTH and sequence.isascii():
+        # Test for each base with a C-level search and only build a set of
+        # whatever else is left, instead of hashing every character
+        data = sequence.encode('ascii')
+        others = data.translate(None, _VALID_BASES)
+        unique_count = sum(base in data for base in _VALID_BASES) + len(set(others))
+    else:
+        unique_count = len(set(sequence))
+    
+    unique_ratio = unique_count / len(sequence)
+    
+    return unique_count < min_unique_chars or unique_ratio < min_unique_ratio
+
+
+def count_bases(sequence: str) -> Tuple[int, int, int, int, int]:
+    """Count A, T, G, C and N bases in either case.
     
-    return len(unique_chars) < min_unique_chars or unique_ratio < min_unique_ratio
+    Args:
+        sequence (str): DNA sequence
+        
+    Returns:
+        Tuple[int, int, int, int, int]: A, T, G, C and N counts
+    """
+    if len(sequence) >= BINCOUNT_MIN_LENGTH and sequence.isascii():
+        # One histogram pass over the bytes counts both cases without an
+        # upper-cased copy; chunking bounds the encoded and intp temporaries
+        counts = np.zeros(256, dtype=np.int64)
+        for start in range(0, len(sequence), BINCOUNT_CHUNK_SIZE):
+            chunk = sequence[start:start + BINCOUNT_CHUNK_SIZE].encode('ascii')
+            counts += np.bincount(np.frombuffer(chunk, dtype=np.uint8), minlength=256)
+        return tuple((counts[_BASE_BYTES] + counts[_LOWER_BASE_BYTES]).tolist())
+    
+    # Short or non-ASCII sequences: upper() plus str.count is faster here and
+    # keeps Unicode case mapping
+    count = sequence.upper().count
+    return count('A'), count('T'), count('G'), count('C'), count('N')
 
 
 def calculate_gc_content(sequence: str) -> float:
@@ -156,10 +466,9 @@ def calculate_gc_content(sequence: str) -> float:
     if not sequence:
         return 0.0
     
-    seq_upper = sequence.upper()
-    gc_count = seq_upper.count('G') + seq_upper.count('C')
-    at_count = seq_upper.count('A') + seq_upper.count('T')
-    valid_bases = gc_count + at_count
+    a_count, t_count, g_count, c_count, _ = count_bases(sequence)
+    gc_count = g_count + c_count
+    valid_bases = gc_count + a_count + t_count
     
     if valid_bases == 0:
         return 0.0
@@ -188,18 +497,21 @@ def calculate_sequence_stats(sequence: str) -> Dict:
             "valid_chars": 0
         }
     
-    seq_upper = sequence.upper()
+    # Count every base in one pass and derive GC content from the counts
+    a_count, t_count, g_count, c_count, n_count = count_bases(sequence)
+    gc_count = g_count + c_count
+    valid_chars = gc_count + a_count + t_count
     
     stats = {
-        "length": len(seq_upper),
-        "gc_content": calculate_gc_content(seq_upper),
-        "a_count": seq_upper.count('A'),
-        "t_count": seq_upper.count('T'),
-        "g_count": seq_upper.count('G'),
-        "c_count": seq_upper.count('C'),
-        "n_count": seq_upper.count('N'),
-        "valid_chars": seq_upper.count('A') + seq_upper.count('T') + 
-                      seq_upper.count('G') + seq_upper.count('C')
+        # upper() can lengthen some non-ASCII characters
+        "length": len(sequence) if sequence.isascii() else len(sequence.upper()),
+        "gc_content": (gc_count / valid_chars) * 100 if valid_chars else 0.0,
+        "a_count": a_count,
+        "t_count": t_count,
+        "g_count": g_count,
+        "c_count": c_count,
+        "n_count": n_count,
+        "valid_chars": valid_chars
     }
     
     return stats
@@ -217,6 +529,10 @@ def filter_valid_sequences(validation_results: List[Dict]) -> List[Dict]:
     return [result for result in validation_results if result["is_valid"]]
 
 
+# Summary labels that differ from ``ERROR_TYPES``
+_SUMMARY_ERROR_LABELS = {"duplicate_header": "Duplicate headers"}
+
+
 def get_validation_summary(validation_results: List[Dict]) -> Dict:
     """Generate a summary of validation results.
     
@@ -227,6 +543,139 @@ def get_validation_summary(validation_results: List[Dict]) -> Dict:
         Dict: Summary statistics
     """
     if not validation_results:
+        return _build_summary(0, 0, 0, 0, {})
+    
+    # Count validity, sanitization, duplicate headers and errors by type in one pass
+    valid = sanitized = duplicate_headers = 0
+    code_counts = Counter()
+    for result in validation_results:
+        valid += result["is_valid"]
+        sanitized += is_sanitized(result)
+        codes = error_codes(result)
+        if codes:
+            duplicate_headers += "duplicate_header" in codes
+            code_counts.update(codes)
+    
+    return _build_summary(len(validation_results), valid, sanitized, duplicate_headers, code_counts)
+
+
+def summarize_sequences(sequences: Iterable[tuple], min_length: int = 20, sanitize: bool = False,
+                        executor: Optional[Executor] = None, chunk_size: int = 2000,
+                        on_chunk: Optional[Callable[[List[Dict]], None]] = None) -> Dict:
+    """Validate a stream of sequences and return only their summary.
+    
+    Gives the same result as ``get_validation_summary`` on the output of
+    ``validate_sequences``, but each chunk's results are counted and
+    dropped as it completes. Only a tally per distinct header is kept,
+    for duplicate-header detection at the end.
+    
+    Args:
+        sequences (Iterable[tuple]): (header, sequence) tuples, e.g. from
+            ``iter_sequences``
+        min_length (int): Minimum acceptable sequence length
+        sanitize (bool): If True, attempt to clean invalid characters
+        executor (Executor, optional): Pool to run chunks on; validates
+            serially when not given
+        chunk_size (int): Number of sequences per chunk
+        on_chunk (Callable, optional): Called in order with each chunk's
+            results, before duplicate headers are checked
+        
+    Returns:
+        Dict: Summary statistics
+    """
+    sequences = iter(sequences)
+    chunks = iter(lambda: list(islice(sequences, chunk_size)), [])
+    if executor is not None:
+        chunk_results = _map_bounded(executor, chunks, min_length, sanitize)
+    else:
+        chunk_results = map(_validate_chunk, chunks, repeat(min_length), repeat(sanitize))
+    
+    total = valid = sanitized = 0
+    code_counts = Counter()
+    # Where each error code first appears, to order error types as
+    # get_validation_summary does
+    first_seen = {}
+    # header -> [occurrences, first index, occurrences valid on their own]
+    header_tally = {}
+    
+    for results in chunk_results:
+        if on_chunk is not None:
+            on_chunk(results)
+        
+        for result in results:
+            is_valid = result["is_valid"]
+            valid += is_valid
+            if is_sanitized(result):
+                sanitized += 1
+            
+            for position, code in enumerate(result["error_codes"]):
+                code_counts[code] += 1
+                first_seen.setdefault(code, (total, position))
+            
+            tally = header_tally.get(result["header"])
+            if tally is None:
+                header_tally[result["header"]] = [1, total, int(is_valid)]
+            else:
+                tally[0] += 1
+                tally[2] += is_valid
+            total += 1
+    
+    # Every occurrence of a repeated header gets a duplicate-header error,
+    # added after its own errors
+    duplicate_headers = 0
+    first_duplicate = total
+    for count, first_index, valid_count in header_tally.values():
+        if count > 1:
+            duplicate_headers += count
+            valid -= valid_count
+            first_duplicate = min(first_duplicate, first_index)
+    if duplicate_headers:
+        code_counts["duplicate_header"] = duplicate_headers
+        first_seen["duplicate_header"] = (first_duplicate, float("inf"))
+    
+    ordered_counts = {code: code_counts[code] for code in sorted(code_counts, key=first_seen.get)}
+    return _build_summary(total, valid, sanitized, duplicate_headers, ordered_counts)
+
+
+def _map_bounded(executor: Executor, chunks: Iterator[List[tuple]], min_length: int,
+                 sanitize: bool) -> Iterator[List[Dict]]:
+    """Validate chunks on ``executor`` in order, with at most ``MAX_PENDING_CHUNKS`` in flight.
+    
+    Unlike ``Executor.map``, chunks are only read from ``chunks`` as
+    earlier ones complete, so a streamed input is never held in full.
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(_validate_chunk, chunk, min_length, sanitize))
+        if len(pending) >= MAX_PENDING_CHUNKS:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def is_sanitized(result: Dict) -> bool:
+    """Check whether sanitizing changed a result's sequence.
+    
+    Uses the ``sanitized`` flag set by ``validate_sequence``; results built
+    elsewhere without it fall back to comparing ``corrected_sequence``
+    with ``original_sequence``.
+    
+    Args:
+        result (Dict): Validation result
+        
+    Returns:
+        bool: True if the sequence was changed by sanitizing
+    """
+    if "sanitized" in result:
+        return result["sanitized"]
+    corrected = result.get("corrected_sequence")
+    return bool(corrected) and corrected != result.get("original_sequence", "")
+
+
+def _build_summary(total: int, valid: int, sanitized: int, duplicate_headers: int,
+                   code_counts: Dict[str, int]) -> Dict:
+    """Assemble the summary dict from counts; ``code_counts`` order sets ``error_types`` order."""
+    if not total:
         return {
             "total_sequences": 0,
             "valid_sequences": 0,
@@ -237,44 +686,20 @@ def get_validation_summary(validation_results: List[Dict]) -> Dict:
             "error_types": {}
         }
     
-    total = len(validation_results)
-    valid = sum(1 for result in validation_results if result["is_valid"])
+    error_type_counts = {
+        _SUMMARY_ERROR_LABELS.get(code, ERROR_TYPES[code]): count
+        for code, count in code_counts.items()
+    }
     invalid = total - valid
     
-    sanitized = sum(1 for result in validation_results 
-                   if result.get("corrected_sequence") and 
-                   result.get("corrected_sequence") != result.get("original_sequence", ""))
-    
-    # Count duplicate headers
-    duplicate_headers = sum(1 for result in validation_results 
-                          if any("Duplicate header" in error for error in result["errors"]))
-    
-    # Count total errors and types
-    all_errors = []
-    for result in validation_results:
-        all_errors.extend(result["errors"])
-    
-    error_type_counts = Counter()
-    for error in all_errors:
-        if "Invalid characters" in error:
-            error_type_counts["Invalid characters"] += 1
-        elif "too short" in error:
-            error_type_counts["Too short"] += 1
-        elif "Duplicate header" in error:
-            error_type_counts["Duplicate headers"] += 1
-        elif "Empty sequence" in error:
-            error_type_counts["Empty sequence"] += 1
-        else:
-            error_type_counts["Other"] += 1
-    
     return {
         "total_sequences": total,
         "valid_sequences": valid,
         "invalid_sequences": invalid,
         "sanitized_sequences": sanitized,
         "duplicate_headers": duplicate_headers,
-        "total_errors": len(all_errors),
-        "error_types": dict(error_type_counts),
+        "total_errors": sum(code_counts.values()),
+        "error_types": error_type_counts,
         "validity_percentage": (valid / total) * 100 if total > 0 else 0,
         "sanitization_rate": (sanitized / total) * 100 if total > 0 else 0
     }
@@ -7,9 +7,11 @@ Author: noomesk
 import pytest
 import tempfile
 import os
-from pathlib import Path
+import bz2
+import gzip
+import io
 
-from src.parser import load_sequences, _parse_fasta, _parse_fastq, detect_file_format, ParsingError
+from src.parser import _ThreadedReader, iter_sequences, load_sequences, load_sequences_from_bytes, load_sequences_with_format, _parse_fasta, _parse_fastq, detect_file_format, format_fasta_record, ParsingError
 
 
 class TestParser:
@@ -106,6 +108,75 @@ class TestParser:
         finally:
             os.unlink(temp_path)
     
+    def test_load_sequences_compressed_files(self):
+        """Test loading gzip and bzip2 compressed files."""
+        fastq_content = b"@seq1\nACGTACGT\n+\nIIIIIIII\n@seq2\nTTTTAAAA\n+\nTTTTTTTT\n"
+        
+        for compress in (gzip.compress, bz2.compress):
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.fastq.gz', delete=False) as f:
+                f.write(compress(fastq_content))
+                temp_path = f.name
+            
+            try:
+                result = load_sequences(temp_path)
+                
+                assert result == [("seq1", "ACGTACGT"), ("seq2", "TTTTAAAA")]
+                assert detect_file_format(temp_path) == "fastq"
+            finally:
+                os.unlink(temp_path)
+    
+    def test_iter_sequences_read_errors(self):
+        """Test truncated or undecodable files raise ParsingError when streamed."""
+        contents = [
+            gzip.compress(b">seq1\n" + b"ACGT" * 10000 + b"\n")[:-20],
+            b">seq1\nACGT\xff\n"
+        ]
+        
+        for content in contents:
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.fasta.gz', delete=False) as f:
+                f.write(content)
+                temp_path = f.name
+            
+            try:
+                with pytest.raises(ParsingError, match="Error reading file"):
+                    list(iter_sequences(temp_path))
+            finally:
+                os.unlink(temp_path)
+    
+    def test_threaded_reader_repeats_errors(self):
+        """Test a failed background read is raised again on later reads."""
+        content = gzip.compress(b"ACGT" * 10000)[:-20]
+        raw = io.BytesIO(content)
+        reader = _ThreadedReader(gzip.GzipFile(fileobj=raw, mode='rb'), raw)
+        
+        try:
+            for _ in range(3):
+                with pytest.raises(EOFError):
+                    while reader.read(1 << 16):
+                        pass
+        finally:
+            reader.close()
+    
+    def test_load_sequences_with_format(self):
+        """Test that the detected format is returned with the sequences."""
+        contents = {
+            "fasta": b"\n>seq1\nACGT\nACGT\n",
+            "fastq": gzip.compress(b"@seq1\nACGTACGT\n+\nIIIIIIII\n")
+        }
+        
+        for expected_format, content in contents.items():
+            with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+                f.write(content)
+                temp_path = f.name
+            
+            try:
+                file_format, result = load_sequences_with_format(temp_path)
+                
+                assert file_format == expected_format
+                assert result == load_sequences(temp_path)
+            finally:
+                os.unlink(temp_path)
+    
     def test_load_sequences_empty_file(self):
         """Test loading from empty file."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.fasta', delete=False) as f:
@@ -137,6 +208,22 @@ class TestParser:
         finally:
             os.unlink(temp_path)
     
+    def test_load_sequences_from_bytes(self):
+        """Test parsing FASTA and FASTQ content from bytes."""
+        fasta_result = load_sequences_from_bytes(b">seq1\nACGT\nACGT\n>seq2\nTTTT\n")
+        fastq_result = load_sequences_from_bytes(b"@seq1\nACGTACGT\n+\nIIIIIIII\n")
+        
+        assert fasta_result == [("seq1", "ACGTACGT"), ("seq2", "TTTT")]
+        assert fastq_result == [("seq1", "ACGTACGT")]
+    
+    def test_load_sequences_from_bytes_errors(self):
+        """Test error handling when parsing from bytes."""
+        with pytest.raises(ParsingError, match="File is empty"):
+            load_sequences_from_bytes(b"  \n")
+        
+        with pytest.raises(ParsingError, match="Error decoding file"):
+            load_sequences_from_bytes(b">seq1\n\xff\xfe\n")
+    
     def test_detect_file_format_fasta(self):
         """Test detecting FASTA format."""
         fasta_content = ">seq1\nACGTACGT\n>seq2\nTTTTAAAA\n"
@@ -181,35 +268,28 @@ class TestParser:
     
     def test_load_sequences_with_special_characters_in_headers(self):
         """Test parsing headers with special characters."""
-        fasta_content = ">seq_1|description|extra\nACGTACGT\n>seq-2.description\nTTTTAAAA\n"
+        fasta_content = b">seq_1|description|extra\nACGTACGT\n>seq-2.description\nTTTTAAAA\n"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.fasta', delete=False) as f:
-            f.write(fasta_content)
-            temp_path = f.name
+        result = load_sequences_from_bytes(fasta_content)
         
-        try:
-            result = load_sequences(temp_path)
-            
-            assert len(result) == 2
-            assert result[0][0] == "seq_1|description|extra"
-            assert result[1][0] == "seq-2.description"
-        finally:
-            os.unlink(temp_path)
+        assert len(result) == 2
+        assert result[0][0] == "seq_1|description|extra"
+        assert result[1][0] == "seq-2.description"
     
     def test_load_sequences_whitespace_handling(self):
         """Test handling of whitespace in sequences."""
-        fasta_content = ">seq1\nA C G T\n\tA C G T\n>seq2\nT T T T\n"
+        fasta_content = b">seq1\nA C G T\n\tA C G T\n>seq2\nT T T T\n"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.fasta', delete=False) as f:
-            f.write(fasta_content)
-            temp_path = f.name
+        result = load_sequences_from_bytes(fasta_content)
         
-        try:
-            result = load_sequences(temp_path)
-            
-            assert len(result) == 2
-            # Parser preserves whitespace as-is when joining lines
-            assert result[0][1] == "A C G TA C G T"  # Whitespace preserved
-            assert result[1][1] == "T T T T"
-        finally:
-            os.unlink(temp_path)
+        assert len(result) == 2
+        # Parser preserves whitespace as-is when joining lines
+        assert result[0][1] == "A C G TA C G T"  # Whitespace preserved
+        assert result[1][1] == "T T T T"
+    
+    def test_format_fasta_record_wraps_lines(self):
+        """Test FASTA records are wrapped at 60 characters."""
+        record = format_fasta_record("seq1", "A" * 130)
+        
+        assert record == ">seq1\n" + "A" * 60 + "\n" + "A" * 60 + "\n" + "A" * 10 + "\n"
+        assert load_sequences_from_bytes(record.encode()) == [("seq1", "A" * 130)]
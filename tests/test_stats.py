@@ -20,6 +20,7 @@ from src.stats import (
     _calculate_quartiles,
     _classify_error
 )
+from src.validator import validate_sequences
 
 
 class TestStats:
@@ -410,6 +411,21 @@ class TestStats:
         
         assert report["summary"]["duplicate_headers"] == 2
     
+    def test_generate_report_without_details(self):
+        """Test that per-sequence sections can be left out of the report."""
+        validation_results = validate_sequences(
+            [(f"seq{i}", "ACGT" * (i + 1)) for i in range(15)], min_length=20
+        )
+        
+        full = generate_report(validation_results)
+        summary = generate_report(validation_results, details=False)
+        
+        assert "sequence_statistics" not in summary
+        assert "invalid_sequences_detail" not in summary
+        for section in ("summary", "sequence_lengths", "gc_content", "top_10_longest", "error_analysis"):
+            assert summary[section] == full[section]
+        assert "sequence_statistics" not in generate_report([], details=False)
+    
     def test_save_report_file_creation_error(self):
         """Test error handling when file cannot be created."""
         validation_results = [
@@ -4,15 +4,23 @@ Unit tests for validator module.
 Author: noomesk
 """
 
+import gc
 import pytest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 
 from src.validator import (
     validate_sequence, 
     validate_sequences, 
+    validate_sequences_parallel,
+    summarize_sequences,
     calculate_gc_content, 
     calculate_sequence_stats,
     filter_valid_sequences,
-    get_validation_summary
+    get_validation_summary,
+    quality_level,
+    error_codes,
+    count_bases
 )
 
 
@@ -112,6 +120,107 @@ class TestValidator:
         duplicate_results = [r for r in results if "Duplicate header" in r["errors"]]
         assert len(duplicate_results) == 2  # Both occurrences of "seq1"
     
+    def test_validate_sequences_parallel_matches_serial(self):
+        """Test that chunked parallel validation matches serial validation."""
+        sequences = [(f"seq{i % 7}", "ACGTNX"[i % 6] * (i % 40)) for i in range(50)]
+        sequences.append(("unique", "ACGTACGTACGTACGTACGTACGT"))
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = validate_sequences_parallel(
+                sequences, min_length=10, sanitize=True, executor=executor, chunk_size=8
+            )
+        
+        # Duplicates spanning chunks are still detected
+        assert parallel == validate_sequences(sequences, min_length=10, sanitize=True)
+    
+    def test_validate_sequences_batches_match_single_validation(self):
+        """Test that batched validation matches validate_sequence across batch boundaries."""
+        sequences = [(f"seq{i}", ["ACGT", "acgt", "ACGX", "NNNN"][i % 4] * (i % 12)) for i in range(25)]
+        
+        with patch("src.validator.BATCH_MAX_SEQUENCES", 4):
+            results = validate_sequences(sequences, min_length=10, sanitize=True)
+        
+        for (header, sequence), result in zip(sequences, results):
+            expected = validate_sequence(header, sequence, min_length=10, sanitize=True)
+            assert {key: result[key] for key in expected} == expected
+    
+    def test_validate_sequences_parallel_on_chunk(self):
+        """Test that chunk results are reported in order as they complete."""
+        sequences = [(f"seq{i}", "ACGT" * 10) for i in range(25)]
+        reported = []
+        
+        results = validate_sequences_parallel(
+            sequences, min_length=10, chunk_size=10, on_chunk=reported.append
+        )
+        
+        assert [len(chunk) for chunk in reported] == [10, 10, 5]
+        assert [r["header"] for chunk in reported for r in chunk] == [r["header"] for r in results]
+    
+    def test_summarize_sequences_matches_summary(self):
+        """Test that streamed summaries match summaries of the full results."""
+        sequences = [(f"seq{i % 9}", "ACGTNX "[i % 7] * (i % 30)) for i in range(60)]
+        expected = get_validation_summary(validate_sequences(sequences, min_length=10, sanitize=True))
+        
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = summarize_sequences(
+                iter(sequences), min_length=10, sanitize=True, executor=executor, chunk_size=7
+            )
+        serial = summarize_sequences(iter(sequences), min_length=10, sanitize=True, chunk_size=4)
+        
+        assert serial == parallel == expected
+        assert list(serial["error_types"]) == list(expected["error_types"])
+        assert summarize_sequences(iter([])) == get_validation_summary([])
+    
+    def test_validate_sequences_quality_levels(self):
+        """Test quality level assignment, including duplicate-header errors."""
+        sequences = [
+            ("warn", "ACGTTGCAAGCTTAGCCGATACGTTGCAAGCT"),
+            ("fixable", "ACGTXXACGTTGCAAGCTTAGCCGATACGTT"),
+            ("dup", "ACGTTGCAAGCTTAGCCGATACGTTGCAAGCT"),
+            ("dup", "ACGTTGCAAGCTTAGCCGATACGTTGCAAGCT")
+        ]
+        
+        results = validate_sequences(sequences, min_length=20)
+        
+        assert [r["quality"] for r in results] == [
+            "medium_quality", "low_quality", "unusable", "unusable"
+        ]
+        assert quality_level({"errors": [], "warnings": []}) == "high_quality"
+    
+    def test_validate_sequences_error_codes(self):
+        """Test that each error message has a matching error code."""
+        sequences = [("seq1", "ACGX"), ("seq1", ""), ("seq2", "ACGTACGT")]
+        
+        results = validate_sequences(sequences, min_length=5)
+        
+        assert [r["error_codes"] for r in results] == [
+            ["invalid_characters", "too_short", "duplicate_header"],
+            ["empty_sequence", "duplicate_header"],
+            []
+        ]
+        assert error_codes({"errors": ["Duplicate header", "Oops"]}) == ["duplicate_header", "other"]
+    
+    def test_validate_sequences_restores_gc_state(self):
+        """Test that the garbage collector is left as it was found."""
+        sequences = [("seq1", "ACGTACGT"), ("seq2", "ACGX")]
+        
+        assert gc.isenabled()
+        validate_sequences(sequences, min_length=5)
+        assert gc.isenabled()
+        
+        gc.disable()
+        try:
+            validate_sequences_parallel(sequences, min_length=5)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+        
+        # Callbacks never run inside the pause
+        states = []
+        validate_sequences_parallel(sequences, min_length=5, chunk_size=1,
+                                    on_chunk=lambda chunk: states.append(gc.isenabled()))
+        assert states == [True, True]
+    
     def test_filter_valid_sequences(self):
         """Test filtering valid sequences."""
         results = [
@@ -184,6 +293,26 @@ class TestValidator:
         assert result["is_valid"] is True
         assert result["corrected_sequence"] == "ACGTNNN"  # Invalid chars replaced with N
     
+    def test_validate_sequence_non_ascii(self):
+        """Test that non-ASCII characters are reported and sanitized."""
+        result = validate_sequence("seq1", "acgtéACGT", min_length=5, sanitize=True)
+        
+        assert result["errors"] == ["Invalid characters found: É"]
+        assert result["corrected_sequence"] == "ACGTNACGT"
+    
+    def test_validate_sequence_invalid_characters_sorted(self):
+        """Test that invalid characters are listed in sorted order."""
+        result = validate_sequence("seq1", "ZACGTXYACGT", min_length=5)
+        
+        assert result["errors"] == ["Invalid characters found: X, Y, Z"]
+    
+    def test_validate_sequence_sanitized_flag(self):
+        """Test that the sanitized flag is set only when the sequence changed."""
+        assert validate_sequence("seq1", "ACGTXACGT", min_length=5, sanitize=True)["sanitized"] is True
+        assert validate_sequence("seq1", "acgtacgt", min_length=5, sanitize=True)["sanitized"] is True
+        assert validate_sequence("seq1", "ACGTACGT", min_length=5, sanitize=True)["sanitized"] is False
+        assert validate_sequence("seq1", "ACGTXACGT", min_length=5, sanitize=False)["sanitized"] is False
+    
     def test_validate_sequence_very_short(self):
         """Test validation with very short sequence."""
         result = validate_sequence("seq1", "A", min_length=20, sanitize=False)
@@ -213,6 +342,13 @@ class TestValidator:
         assert calculate_gc_content("GCGCNN") == 100.0  # 4/4 valid bases are GC
         assert calculate_gc_content("ATATNN") == 0.0    # 4/4 valid bases are AT
     
+    def test_count_bases(self):
+        """Test base counting for short and long, mixed-case sequences."""
+        assert count_bases("AaTtGgCcNnX") == (2, 2, 2, 2, 2)
+        assert count_bases("acgtn" * 500) == (500, 500, 500, 500, 500)
+        assert count_bases("ACGTn" * 30000) == (30000, 30000, 30000, 30000, 30000)
+        assert count_bases("") == (0, 0, 0, 0, 0)
+    
     def test_calculate_sequence_stats_empty(self):
         """Test stats calculation for empty sequence."""
         stats = calculate_sequence_stats("")
@@ -272,3 +408,12 @@ class TestValidator:
         
         assert summary["sanitized_sequences"] == 1
         assert summary["sanitization_rate"] == 50.0
+    
+    def test_validation_summary_counts_only_changed_sequences(self):
+        """Test that only sequences changed by sanitizing count as sanitized."""
+        sequences = [("seq1", "ACGTXACGT"), ("seq2", "ACGTACGT"), ("seq3", "acgtacgt")]
+        
+        assert get_validation_summary(validate_sequences(sequences, min_length=5))["sanitized_sequences"] == 0
+        
+        summary = get_validation_summary(validate_sequences(sequences, min_length=5, sanitize=True))
+        assert summary["sanitized_sequences"] == 2